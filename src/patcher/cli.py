@@ -2,22 +2,21 @@ import asyncio
 import inspect
 import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import asyncclick as click
 
 from .__about__ import __version__
-from .client.analyze import Analyzer, FilterCriteria, TrendCriteria
-from .client.api_client import ApiClient
 from .client.config_manager import ConfigManager
-from .client.report_manager import ReportManager
 from .client.setup import Setup
 from .client.ui_manager import UIConfigManager
 from .utils.animation import Animation
-from .utils.data_manager import DataManager
 from .utils.exceptions import APIResponseError, PatcherError
 from .utils.logger import LogMe, PatcherLog
-from .utils.pdf_report import PDFReport
+
+# Reporting modules pull in pandas and fpdf, they are imported by the commands that need them
+if TYPE_CHECKING:
+    from .utils.data_manager import DataManager
 
 DATE_FORMATS = {
     "Month-Year": "%B %Y",  # April 2024
@@ -47,7 +46,7 @@ def format_err(exc: PatcherError) -> None:
     )
 
 
-def get_data_manager(ctx: click.Context) -> DataManager:
+def get_data_manager(ctx: click.Context) -> "DataManager":
     """
     Lazily initializes and returns the shared ``DataManager`` instance.
 
@@ -59,6 +58,8 @@ def get_data_manager(ctx: click.Context) -> DataManager:
     :rtype: :class:`~patcher.utils.data_manager.DataManager`
     """
     if "data_manager" not in ctx.obj or ctx.obj.get("data_manager") is None:
+        from .utils.data_manager import DataManager
+
         ctx.obj["data_manager"] = DataManager(disable_cache=ctx.obj.get("disable_cache", False))
     return ctx.obj["data_manager"]
 
@@ -245,8 +246,7 @@ async def reset(ctx: click.Context, kind: str, credential: Optional[str]) -> Non
                         "CLIENT_ID": click.prompt("Enter your API Client ID"),
                         "CLIENT_SECRET": click.prompt("Enter your API Client Secret"),
                     }
-                    for k, v in cred_map.items():
-                        config.set_credential(k, v)
+                    config.set_credentials(cred_map)
         elif kind.lower() == "cache":
             log.info("Removing cached data...")
 
@@ -357,6 +357,11 @@ async def export(
     :param concurrency: The maximum number of API requests that can be sent at once. Defaults to 5.
     :type concurrency: :py:class:`int`
     """
+    from .client.api_client import ApiClient
+    from .client.report_manager import ReportManager
+    from .utils.data_manager import DataManager
+    from .utils.pdf_report import PDFReport
+
     data_manager = DataManager(disable_cache=ctx.obj.get("disable_cache"))
     ctx.obj["data_manager"] = data_manager  # Store in context for analyze
 
@@ -462,6 +467,8 @@ async def analyze(
         )
         return
 
+    from .client.analyze import Analyzer, FilterCriteria, TrendCriteria
+
     animation = ctx.obj.get("animation")
     ui_config = ctx.obj.get("ui_config")
     data_manager = get_data_manager(ctx)
@@ -1,7 +1,9 @@
 import asyncio
 import json
 import subprocess
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 from ..models.jamf_client import ApiClientModel, ApiRoleModel
 from ..utils.exceptions import APIResponseError, PatcherError, ShellCommandError
@@ -9,6 +11,11 @@ from ..utils.logger import LogMe
 
 
 class BaseAPIClient:
+    # Jamf Pro API endpoints used during setup
+    _AUTH_TOKEN_PATH = "/api/v1/auth/token"
+    _API_ROLES_PATH = "/api/v1/api-roles"
+    _API_INTEGRATIONS_PATH = "/api/v1/api-integrations"
+
     def __init__(self, max_concurrency: int = 5):
         """
         The BaseAPIClient class controls concurrency settings and secure connections for *all* API calls.
@@ -28,6 +35,8 @@ class BaseAPIClient:
         self.max_concurrency = max_concurrency
         self.semaphore = asyncio.Semaphore(max_concurrency)
         self.default_headers = {"accept": "application/json", "Content-Type": "application/json"}
+        self._default_header_args = self._format_headers(self.default_headers)
+        self._bearer_headers = None  # (token, headers) shared by setup API calls
         self.log = LogMe(self.__class__.__name__)
         self.log.debug(f"BaseAPIClient initialized with max_concurrency: {max_concurrency}")
 
@@ -66,6 +75,37 @@ class BaseAPIClient:
             formatted_headers.extend(["-H", f"{k}: {v}"])
         return formatted_headers
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _role_payload() -> Dict:
+        """Request body for creating the Patcher API role, built once. Must not be modified."""
+        role = ApiRoleModel()
+        return {"displayName": role.display_name, "privileges": role.privileges}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _client_payload() -> Dict:
+        """Request body for creating the Patcher API client, built once. Must not be modified."""
+        client = ApiClientModel()
+        return {
+            "authorizationScopes": client.auth_scopes,
+            "displayName": client.display_name,
+            "enabled": client.enabled,
+            "accessTokenLifetimeSeconds": client.token_lifetime,
+        }
+
+    def _setup_headers(self, token: str) -> Dict[str, str]:
+        """
+        Headers for setup API calls authorized by ``token``. Rebuilt only when the token changes,
+        callers must not modify the returned dict.
+        """
+        if self._bearer_headers is None or self._bearer_headers[0] != token:
+            self._bearer_headers = (
+                token,
+                {**self.default_headers, "Authorization": f"Bearer {token}"},
+            )
+        return self._bearer_headers[1]
+
     def _handle_status_code(self, status_code: int, response_json: Optional[Dict]) -> Dict:
         """Handles HTTP status codes and returns the appropriate response or raises errors."""
         self.log.debug(f"Parsing API response. (status code: {status_code})")
@@ -119,6 +159,18 @@ class BaseAPIClient:
 
         return sanitized
 
+    def _command_str(self, command: List[str]) -> str:
+        """Sanitized, single-line form of ``command`` for logs and error messages."""
+        return " ".join(self._sanitize_command(command)).replace("\n", "")
+
+    def _log_command(self, command: List[str], mode: str) -> None:
+        """
+        Logs the command about to be executed. Sanitizing walks every argument (including
+        payloads), so it is skipped unless the debug line is emitted.
+        """
+        if self.log.debug_enabled:
+            self.log.debug(f"Attempting to execute {self._command_str(command)} command {mode}")
+
     async def execute(self, command: List[str]) -> Union[Dict, str]:
         """
         Asynchronously executes a shell command using subprocess and returns the output.
@@ -136,9 +188,7 @@ class BaseAPIClient:
         :rtype: :py:obj:`~typing.Union` [:py:obj:`~typing.Dict` | :py:class:`str`]
         :raises ShellCommandError: If the command execution fails (returns a non-zero exit code).
         """
-        sanitized_command = self._sanitize_command(command)
-        sanitized_command_str = " ".join(sanitized_command).replace("\n", "")
-        self.log.debug(f"Attempting to execute {sanitized_command_str} command asynchronously")
+        self._log_command(command, "asynchronously")
         try:
             process = await asyncio.create_subprocess_exec(
                 *command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
@@ -148,7 +198,7 @@ class BaseAPIClient:
                 error_msg = stderr.decode().strip()
                 raise ShellCommandError(
                     "Command execution failed.",
-                    command=command,
+                    command=self._command_str(command),
                     error=error_msg,
                     return_code=process.returncode,
                 )
@@ -157,7 +207,7 @@ class BaseAPIClient:
         except OSError as e:
             raise ShellCommandError(
                 "OSError encountered executing command.",
-                command=sanitized_command_str,
+                command=self._command_str(command),
                 error_msg=str(e),
             )
 
@@ -165,7 +215,7 @@ class BaseAPIClient:
         """
         Identical to ``execute`` method, but does not leverage async functionality.
 
-        Method is primarily intended for :class:`~patcher.client.ui_manager.UIConfigManager` to ensure default font files are downloaded properly. See :meth:`~patcher.client.ui_manager.UIConfigManager._download_font` for details.
+        Method is primarily intended for :class:`~patcher.client.ui_manager.UIConfigManager` to ensure default font files are downloaded properly. See :meth:`~patcher.client.ui_manager.UIConfigManager._download_fonts` for details.
 
         .. important::
 
@@ -183,9 +233,7 @@ class BaseAPIClient:
         :rtype: :py:obj:`~typing.Union` [:py:obj:`~typing.Dict` | :py:class:`str`]
         :raises ShellCommandError: If the command execution fails (returns a non-zero exit code).
         """
-        sanitized_command = self._sanitize_command(command)
-        sanitized_command_str = " ".join(sanitized_command).replace("\n", "")
-        self.log.debug(f"Attempting to execute {sanitized_command_str} command (no async).")
+        self._log_command(command, "(no async).")
         try:
             result = subprocess.run(
                 command,  # subprocess expects unpacked list
@@ -200,7 +248,7 @@ class BaseAPIClient:
                 "Command execution failed.",
                 return_code=e.returncode,
                 error_msg=error_msg,
-                command=sanitized_command_str,
+                command=self._command_str(command),
             )
 
     async def fetch_json(
@@ -208,7 +256,7 @@ class BaseAPIClient:
         url: str,
         headers: Optional[Dict[str, str]] = None,
         method: str = "GET",
-        data: Optional[Dict[str, str]] = None,
+        data: Optional[Union[Dict[str, str], str]] = None,
     ) -> Dict:
         """
         Asynchronously fetches JSON data from the specified URL using the specified HTTP method.
@@ -219,15 +267,17 @@ class BaseAPIClient:
         :type headers: :py:obj:`~typing.Optional` [:py:obj:`~typing.Dict`]
         :param method: HTTP method to use ("GET" or "POST"). Defaults to "GET".
         :type method: :py:class:`str`
-        :param data: Optional form data to include for POST request.
-        :type data: :py:obj:`~typing.Optional` [:py:obj:`~typing.Dict`]
+        :param data: Optional data to include for POST request. Strings are sent as-is, allowing
+            callers to encode a body once and reuse it.
+        :type data: :py:obj:`~typing.Optional` [:py:obj:`~typing.Union` [:py:obj:`~typing.Dict` | :py:class:`str`]]
         :return: The fetched JSON data as a dictionary.
         :rtype: :py:obj:`~typing.Dict`
         :raises APIResponseError: If the response payload is not valid JSON, or if command execution fails.
         """
         self.log.debug("Attempting to fetch JSON.")
         final_headers = headers if headers else self.default_headers
-        header_string = self._format_headers(final_headers)
+        # Default headers are formatted once at init, only custom headers need formatting here
+        header_string = self._format_headers(headers) if headers else self._default_header_args
 
         # By using the -w parameter with %{http_code}, we are appending the status code
         # to the end of the API response. This is to handle cases where responses
@@ -246,10 +296,10 @@ class BaseAPIClient:
         # Add form data for POST requests
         if method.upper() == "POST" and data:
             self.log.debug("Adding POST data to the request.")
-            if final_headers.get("Content-Type") == "application/x-www-form-urlencoded":
-                # Format each item separately instead
-                form_data = [item for k, v in data.items() for item in ["-d", f"{k}={v}"]]
-                command.extend(form_data)
+            if isinstance(data, str):
+                command.extend(["-d", data])
+            elif final_headers.get("Content-Type") == "application/x-www-form-urlencoded":
+                command.extend(["-d", urlencode(data)])
             else:
                 # JSON is assumed for other content types
                 json_payload = json.dumps(data)
@@ -315,10 +365,11 @@ class BaseAPIClient:
         :type jamf_url: :py:class:`str`
         :returns: The BasicToken string.
         :rtype: :py:class:`str`
-        :raises APIResponseError: If the call is unauthorized or unsuccessful.
+        :raises APIResponseError: If the call is unauthorized or unsuccessful. The HTTP status code,
+            if one was received, is included as ``status_code`` in the exception context.
         """
         self.log.debug("Attempting to retrieve Basic Token with provided credentials.")
-        token_url = f"{jamf_url}/api/v1/auth/token"
+        token_url = jamf_url + self._AUTH_TOKEN_PATH
         command = [
             "/usr/bin/curl",
             "-s",
@@ -329,21 +380,34 @@ class BaseAPIClient:
             "-X",
             "POST",
             token_url,
+            "-w",
+            "\nSTATUS:%{http_code}",
         ]
         async with self.semaphore:
             resp = await self.execute(command)
-            response = json.loads(resp)
-            if response and "token" in response:
-                self.log.info("Basic Token retrieved successfully.")
-                return response.get("token")
-            else:
-                sanitized = self._sanitize_command(command)
-                raise APIResponseError(
-                    "Unable to retrieve basic token with provided username and password",
-                    username=username,
-                    url=jamf_url,
-                    command=sanitized,
-                )
+
+        # Separate the status code appended by -w, so callers can tell rejected credentials apart
+        response_body, _, status_line = resp.rpartition("\nSTATUS:")
+        status_code = int(status_line) if status_line.strip().isdigit() else None
+
+        # Parse the body once; error responses (e.g., 401) may not be JSON at all
+        try:
+            token = json.loads(response_body).get("token")
+        except (json.JSONDecodeError, AttributeError):
+            token = None
+
+        if token:
+            self.log.info("Basic Token retrieved successfully.")
+            return token
+
+        sanitized = self._sanitize_command(command)
+        raise APIResponseError(
+            "Unable to retrieve basic token with provided username and password",
+            username=username,
+            url=jamf_url,
+            status_code=status_code,
+            command=sanitized,
+        )
 
     async def create_roles(self, token: str, jamf_url: str) -> bool:
         """
@@ -360,21 +424,12 @@ class BaseAPIClient:
         :rtype: :py:class:`bool`
         """
         self.log.debug("Attempting to create Patcher API Role via Jamf API.")
-        role = ApiRoleModel()
-        payload = {
-            "displayName": role.display_name,
-            "privileges": role.privileges,
-        }
-
-        role_url = f"{jamf_url}/api/v1/api-roles"
-        headers = {
-            "accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
+        payload = self._role_payload()
+        role_url = jamf_url + self._API_ROLES_PATH
+        headers = self._setup_headers(token)
         response = await self.fetch_json(url=role_url, headers=headers, method="POST", data=payload)
 
-        if response.get("displayName") == role.display_name:
+        if response.get("displayName") == payload["displayName"]:
             self.log.info("Patcher API Role created successfully.")
             return True
         else:
@@ -396,23 +451,11 @@ class BaseAPIClient:
         :rtype: :py:obj:`~typing.Tuple` [:py:class:`str`, :py:class:`str`]
         """
         self.log.debug("Attempting to create Patcher API Client with Jamf API.")
-        client = ApiClientModel()
-        client_url = f"{jamf_url}/api/v1/api-integrations"
-        payload = {
-            "authorizationScopes": client.auth_scopes,
-            "displayName": client.display_name,
-            "enabled": client.enabled,
-            "accessTokenLifetimeSeconds": client.token_lifetime,
-        }
-
-        headers = {
-            "accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
+        client_url = jamf_url + self._API_INTEGRATIONS_PATH
+        headers = self._setup_headers(token)
 
         response = await self.fetch_json(
-            url=client_url, method="POST", data=payload, headers=headers
+            url=client_url, method="POST", data=self._client_payload(), headers=headers
         )
 
         client_id = response.get("clientId")
@@ -421,7 +464,7 @@ class BaseAPIClient:
 
         # Obtain client secret
         self.log.debug("Attempting to retrieve Patcher API Client Secret from Jamf API.")
-        secret_url = f"{jamf_url}/api/v1/api-integrations/{integration_id}/client-credentials"
+        secret_url = f"{client_url}/{integration_id}/client-credentials"
         secret_response = await self.fetch_json(url=secret_url, method="POST", headers=headers)
         client_secret = secret_response.get("clientSecret")
         self.log.info("Retrieved Patcher API Client Secret successfully.")
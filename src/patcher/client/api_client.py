@@ -26,11 +26,14 @@ class ApiClient(BaseAPIClient):
         """
         self.log = LogMe(self.__class__.__name__)
         self.config = config
-        self.token_manager = TokenManager(config)
+        # Token requests go through this client, sharing its concurrency limit with data calls
+        self.token_manager = TokenManager(config, api_client=self)
 
         # Creds can be loaded here as ApiClient objects can only exist after successful JamfClient creation.
-        self.jamf_client = self.token_manager.attach_client()
+        # Attached through the TokenManager's property so it can reuse the client for token requests
+        self.jamf_client = self.token_manager.client
         self.jamf_url = self.jamf_client.base_url
+        self._auth_headers = None  # (token string, headers) for the current AccessToken
 
         super().__init__(max_concurrency=concurrency)
 
@@ -56,12 +59,21 @@ class ApiClient(BaseAPIClient):
             )
 
     async def _headers(self) -> Dict[str, str]:
-        """Generates headers for API calls, ensuring the latest token is used."""
+        """
+        Generates headers for API calls, ensuring the latest token is used.
+
+        Headers are only rebuilt when the token changes, callers must not modify the returned dict.
+        """
         # Ensure token is valid
         await self.token_manager.ensure_valid_token()
-        latest_token = self.token_manager.token
-        self.log.debug(f"Using token ending in {latest_token.token[-4:]}")
-        return {"accept": "application/json", "Authorization": f"Bearer {latest_token}"}
+        latest_token = self.token_manager.token.token
+        if self._auth_headers is None or self._auth_headers[0] != latest_token:
+            self.log.debug(f"Using token ending in {latest_token[-4:]}")
+            self._auth_headers = (
+                latest_token,
+                {"accept": "application/json", "Authorization": f"Bearer {latest_token}"},
+            )
+        return self._auth_headers[1]
 
     @check_token
     async def get_policies(self) -> List[str]:
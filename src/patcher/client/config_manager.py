@@ -1,3 +1,5 @@
+from typing import Dict
+
 import keyring
 from keyring.errors import KeyringError
 
@@ -58,6 +60,9 @@ class ConfigManager:
         Method is used to securely store sensitive data such as Jamf URL, API Tokens, and API credentials
         such as client ID and client secret.
 
+        The write is synchronous; the credential can be read back as soon as this method returns,
+        so callers do not need to wait before using it.
+
         :param key: The key under which the credential will be stored. This acts as an identifier for the credential.
         :type key: :py:class:`str`
         :param value: The value of the credential to store, such as a password or API token.
@@ -73,6 +78,21 @@ class ConfigManager:
                 "Unable to save credential as expected", key=key, error_msg=str(e)
             )
 
+    def set_credentials(self, credentials: Dict[str, str]) -> None:
+        """
+        Stores multiple credentials in the keyring in a single call.
+
+        Used wherever several related credentials (e.g., URL, client ID and client secret) are saved
+        together, so callers build one mapping instead of issuing a ``set_credential`` call per key.
+
+        :param credentials: Mapping of credential keys to the values to store.
+        :type credentials: :py:obj:`~typing.Dict` [:py:class:`str`, :py:class:`str`]
+        :raises CredentialError: If any of the credentials could not be saved.
+        """
+        self.log.debug(f"Attempting to store credentials for keys: {', '.join(credentials)}")
+        for key, value in credentials.items():
+            self.set_credential(key, value)
+
     def delete_credential(self, key: str) -> bool:
         """
         Deletes the provided credential in the keyring under the specified key. Primarily intended for
@@ -117,8 +137,7 @@ class ConfigManager:
             "TOKEN": token.token,
             "TOKEN_EXPIRATION": str(token.expires),
         }
-        for k, v in credentials.items():
-            self.set_credential(k, v)
+        self.set_credentials(credentials)
 
         self.log.info(
             f"Credentials for JamfClient ending in '{(client.client_id[-4:])}' stored successfully."
@@ -1,14 +1,26 @@
+import asyncio
 import os
-import plistlib
+import re
+import socket
+from contextlib import suppress
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 import asyncclick as click
+from pydantic import ValidationError
 
 from ..models.jamf_client import JamfClient
 from ..models.token import AccessToken
 from ..utils.animation import Animation
-from ..utils.exceptions import APIResponseError, PatcherError, SetupError, TokenError
+from ..utils.exceptions import (
+    APIResponseError,
+    CredentialError,
+    PatcherError,
+    SetupError,
+    TokenError,
+)
 from ..utils.logger import LogMe
 from . import BaseAPIClient
 from .config_manager import ConfigManager
@@ -26,6 +38,38 @@ You will be prompted to enter in the header and footer text for PDF reports, alo
 """
 DOC = "For more information, visit the project documentation: https://patcher.liquidzoo.io\n"
 
+# Styled once at import and written by ``Setup._greet`` in a single echo
+_GREETING = (
+    click.style(GREET, fg="cyan", bold=True)
+    + "\n"
+    + click.style(WELCOME)
+    + click.style(DOC, fg="bright_magenta", bold=True)
+)
+
+
+# Matches the completion flag in XML property lists without a full parse
+_FIRST_RUN_PATTERN = re.compile(rb"<key>first_run_done</key>\s*<(true|false)/>")
+
+
+@lru_cache(maxsize=None)
+def _read_completion(plist_path: str, mtime_ns: int) -> bool:
+    """
+    Reads the ``first_run_done`` flag from the property list. Results are cached per path and
+    modification time, so the file is only parsed again after it has been written to.
+
+    XML property lists are matched directly; the file is only parsed with ``plistlib`` if the
+    flag cannot be found that way (e.g., binary property lists).
+    """
+    with open(plist_path, "rb") as fp:
+        raw = fp.read()
+    match = _FIRST_RUN_PATTERN.search(raw)
+    if match:
+        return match.group(1) == b"true"
+    import plistlib
+
+    plist_data = plistlib.loads(raw)
+    return plist_data.get("Setup", {}).get("first_run_done", False)
+
 
 class SetupType(Enum):
     STANDARD = "standard"
@@ -33,6 +77,15 @@ class SetupType(Enum):
 
 
 class Setup:
+    # Menu choice in ``start`` to setup method
+    _SETUP_TYPE_MAP = {1: SetupType.STANDARD, 2: SetupType.SSO}
+
+    # Credentials each setup method requires
+    _REQUIRED_CREDS = {
+        SetupType.STANDARD: ("USERNAME", "PASSWORD", "URL"),
+        SetupType.SSO: ("CLIENT_ID", "CLIENT_SECRET", "URL"),
+    }
+
     def __init__(
         self,
         config: ConfigManager,
@@ -54,8 +107,10 @@ class Setup:
         self.ui_config = ui_config
         self.plist_path = ui_config.plist_path
         self.log = LogMe(self.__class__.__name__)
-        self.animator = Animation()
+        self._animator = None  # Lazy-loaded, only needed if setup actually runs
         self._completed = None
+        self._api_client = None  # Lazy-loaded, shared across setup API calls
+        self._host_lookup = None  # Pending DNS lookup of the Jamf Pro host, see _resolve_host
 
     @property
     def completed(self) -> bool:
@@ -70,44 +125,74 @@ class Setup:
             self._completed = self._check_completion()
         return self._completed
 
+    @property
+    def animator(self) -> Animation:
+        """
+        The default :class:`~patcher.utils.animation.Animation` used while setup runs.
+
+        :return: The default ``Animation`` instance.
+        :rtype: :class:`~patcher.utils.animation.Animation`
+        """
+        if self._animator is None:
+            self._animator = Animation()
+        return self._animator
+
+    @property
+    def api_client(self) -> BaseAPIClient:
+        """
+        The :class:`~patcher.client.BaseAPIClient` instance shared by all setup API calls.
+
+        :return: The shared ``BaseAPIClient`` instance.
+        :rtype: :class:`~patcher.client.BaseAPIClient`
+        """
+        if self._api_client is None:
+            self._api_client = BaseAPIClient()
+        return self._api_client
+
     @staticmethod
     def _greet():
         """Displays the greeting and welcome messages."""
-        click.echo(click.style(GREET, fg="cyan", bold=True))
-        click.echo(click.style(WELCOME), nl=False)
-        click.echo(click.style(DOC, fg="bright_magenta", bold=True))
+        click.echo(_GREETING)
 
     def _check_completion(self) -> bool:
         """
         Determines if the setup has been completed by checking the presence of a plist file. If the
         property list file cannot be read, an error is logged.
         """
-        if not os.path.exists(self.plist_path):
+        try:
+            mtime_ns = os.stat(self.plist_path).st_mtime_ns
+        except FileNotFoundError:
             self.log.info("Setup plist file not found. Setup is incomplete.")
             return False
 
         try:
-            with open(self.plist_path, "rb") as fp:
-                plist_data = plistlib.load(fp)
-                self.log.info("Setup completion status loaded successfully.")
-                return plist_data.get("Setup", {}).get("first_run_done", False)
-        except plistlib.InvalidFileException as e:
+            completed = _read_completion(str(self.plist_path), mtime_ns)
+            self.log.info("Setup completion status loaded successfully.")
+            return completed
+        except ValueError as e:  # plistlib.InvalidFileException
             self.log.warning(f"Unable to read property list file. Details: {e}")
             return False
 
     def _mark_completion(self, value: bool = False):
-        """Updates the plist file to reflect the completion status of the setup."""
-        # Intentionally calling private method as functionality is needed here.
+        """
+        Updates the plist file to reflect the completion status of the setup. The file is written
+        by ``UIConfigManager``, which replaces it atomically.
+        """
+        # Intentionally calling private methods as functionality is needed here.
         # noinspection PyProtectedMember
         plist_data = self.ui_config._load_plist_file()
+        if plist_data.get("Setup") == {"first_run_done": value}:
+            # Already recorded on disk, skip serializing and rewriting the file
+            self._completed = value
+            return
         plist_data["Setup"] = {"first_run_done": value}
 
-        os.makedirs(os.path.dirname(self.plist_path), exist_ok=True)
         try:
-            with open(self.plist_path, "wb") as fp:
-                plistlib.dump(plist_data, fp)
+            # noinspection PyProtectedMember
+            self.ui_config._write_plist_file(plist_data)
+            self._completed = value
             self.log.info("Setup completion status updated successfully.")
-        except Exception as e:
+        except PatcherError as e:
             self.log.error(f"Could not write to property list ({self.plist_path}). Details: {e}")
             raise SetupError(
                 "Error encountered trying to write to property list file.",
@@ -115,28 +200,59 @@ class Setup:
                 error_msg=str(e),
             )
 
-    def _prompt_credentials(self, setup_type: SetupType) -> Dict:
-        """Prompt for credentials based on the credential type."""
+    @staticmethod
+    def _resolve_host(url: str) -> Optional[asyncio.Future]:
+        """
+        Starts resolving the Jamf Pro host in the event loop's default executor, so the lookup
+        overlaps the remaining credential prompts and the first API call hits the system DNS cache.
+
+        Returns ``None`` if no event loop is running or no host can be parsed from the URL; a
+        malformed URL is left for the first API call to report.
+        """
+        try:
+            host = urlparse(url if "://" in url else f"https://{url}").hostname
+            loop = asyncio.get_running_loop()
+        except (ValueError, RuntimeError):
+            return None
+        return loop.run_in_executor(None, socket.getaddrinfo, host, 443) if host else None
+
+    def _prompt_url(self) -> str:
+        """Prompt for the Jamf Pro URL and start resolving its host."""
+        jamf_url = click.prompt("Enter your Jamf Pro URL")
+        self._host_lookup = self._resolve_host(jamf_url)
+        return jamf_url
+
+    async def _wait_for_host_lookup(self) -> None:
+        """
+        Waits for the host lookup started by ``_prompt_url``. A failure is left for the first API
+        call to report; invalid host names raise UnicodeError (a ValueError) rather than OSError.
+        """
+        if self._host_lookup is not None:
+            with suppress(OSError, ValueError):
+                await self._host_lookup
+            self._host_lookup = None
+
+    def _prompt_credentials(self, setup_type: SetupType, jamf_url: Optional[str] = None) -> Dict:
+        """Prompt for credentials based on the credential type. ``jamf_url`` skips the URL prompt."""
         self.log.info(f"Prompting user for {setup_type.value} credentials.")
+        jamf_url = jamf_url or self._prompt_url()
         if setup_type == SetupType.STANDARD:
             return {
-                "URL": click.prompt("Enter your Jamf Pro URL"),
+                "URL": jamf_url,
                 "USERNAME": click.prompt("Enter your Jamf Pro username"),
                 "PASSWORD": click.prompt("Enter your Jamf Pro password", hide_input=True),
             }
         elif setup_type == SetupType.SSO:
             return {
-                "URL": click.prompt("Enter your Jamf Pro URL"),
+                "URL": jamf_url,
                 "CLIENT_ID": click.prompt("Enter your API Client ID"),
                 "CLIENT_SECRET": click.prompt("Enter your API Client Secret"),
             }
 
-    def _validate_creds(
-        self, creds: Dict, required_keys: Tuple[str, ...], setup_type: SetupType
-    ) -> None:
-        """Validates all required keys are present in the credentials."""
+    def _validate_creds(self, creds: Dict, setup_type: SetupType) -> None:
+        """Validates all keys required by the setup type are present in the credentials."""
         self.log.info(f"Validating credentials for {setup_type.value} setup.")
-        missing_keys = [key for key in required_keys if not creds.get(key)]
+        missing_keys = [key for key in self._REQUIRED_CREDS[setup_type] if not creds.get(key)]
         if missing_keys:
             self.log.error(
                 f"Missing required credential(s): {', '.join(missing_keys)} for {setup_type.value} setup."
@@ -147,17 +263,25 @@ class Setup:
                 setup_type=setup_type.value,
             )
 
-    def _save_creds(self, creds: Dict) -> None:
-        """Save gathered credentials to keychain."""
-        for key, value in creds.items():
-            self.config.set_credential(key, value)
+    async def _save_creds(self, creds: Dict) -> None:
+        """Save gathered credentials to keychain. Keychain writes block, so they run in a worker thread."""
+        await asyncio.to_thread(self.config.set_credentials, creds)
 
     async def _token_fetching(
-        self, setup_type: SetupType = SetupType.STANDARD, creds: Optional[Dict] = None
+        self,
+        setup_type: SetupType = SetupType.STANDARD,
+        creds: Optional[Dict] = None,
+        client: Optional[JamfClient] = None,
     ) -> Union[str, AccessToken]:
-        """Fetches a Token (basic or ``AccessToken``) depending on setup type (Standard or SSO)."""
+        """
+        Fetches a Token (basic or ``AccessToken``) depending on setup type (Standard or SSO).
+
+        For ``AccessToken`` fetching, passing the ``JamfClient`` built during setup avoids reading
+        the just-saved credentials back from the keychain, and the token request is sent through
+        the shared ``api_client`` like every other setup call.
+        """
         if setup_type == SetupType.SSO:
-            token_manager = TokenManager(self.config)
+            token_manager = TokenManager(self.config, client=client, api_client=self.api_client)
             try:
                 return await token_manager.fetch_token()
             except TokenError as e:
@@ -166,9 +290,8 @@ class Setup:
                     error_msg=str(e),
                 )
         elif setup_type == SetupType.STANDARD:
-            api_client = BaseAPIClient()
             try:
-                return await api_client.fetch_basic_token(
+                return await self.api_client.fetch_basic_token(
                     username=creds.get("USERNAME"),
                     password=creds.get("PASSWORD"),
                     jamf_url=creds.get("URL"),
@@ -179,14 +302,79 @@ class Setup:
                 )
                 raise SetupError(
                     "Failed to obtain a Basic Token during setup. Please check your credentials and try again.",
+                    status_code=getattr(e, "context", {}).get("status_code"),
                     error_msg=str(e),
                 )
 
+    async def _fetch_basic_token(
+        self, creds: Dict, animator: Optional[Animation] = None, max_attempts: int = 3
+    ) -> str:
+        """
+        Retrieves a basic token for standard setup. If Jamf Pro rejects the username and password
+        (HTTP 401 or 403), the user is prompted for them again instead of re-sending credentials
+        known to fail. Any other failure, such as a wrong URL or a server error, is raised at once.
+
+        ``creds`` is updated in place with the re-entered username and password. The ``animator``
+        (defaults to ``self.animator``) is paused while prompting.
+        """
+        animator = animator or self.animator
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return await self._token_fetching(setup_type=SetupType.STANDARD, creds=creds)
+            except SetupError as e:
+                if e.context.get("status_code") not in (401, 403) or attempt == max_attempts:
+                    raise
+            self.log.warning(f"Basic token request rejected (attempt {attempt} of {max_attempts}).")
+            async with animator.paused():
+                click.echo(click.style("Unable to authenticate, please try again.", fg="red"))
+                creds["USERNAME"] = click.prompt("Enter your Jamf Pro username")
+                creds["PASSWORD"] = click.prompt("Enter your Jamf Pro password", hide_input=True)
+
+    def _stored_client(self, jamf_url: str) -> Optional[JamfClient]:
+        """
+        Builds a ``JamfClient`` from API client credentials saved by a previous setup, if they
+        belong to ``jamf_url``. Returns ``None`` if none are stored for that server, or if either
+        URL or the stored credentials are invalid; a malformed ``jamf_url`` is left for the first
+        API call to report.
+        """
+        try:
+            stored_url = self.config.get_credential("URL")
+            if not stored_url or JamfClient.valid_url(stored_url) != JamfClient.valid_url(jamf_url):
+                return None
+            client_id = self.config.get_credential("CLIENT_ID")
+            client_secret = self.config.get_credential("CLIENT_SECRET")
+            if not (client_id and client_secret):
+                return None
+            return JamfClient(client_id=client_id, client_secret=client_secret, server=stored_url)
+        except CredentialError as e:
+            self.log.warning(f"Unable to read stored API client credentials. Details: {e}")
+        except (ValueError, ValidationError) as e:
+            self.log.warning(f"Unable to use stored API client credentials. Details: {e}")
+        return None
+
+    async def _existing_integration(self, client: JamfClient) -> bool:
+        """
+        Checks whether the API integration of a previous setup (see ``_stored_client``) can still
+        obtain an ``AccessToken``, which is saved to the keychain. If not, a new integration must
+        be created.
+        """
+        try:
+            await self._token_fetching(setup_type=SetupType.SSO, client=client)
+        except SetupError:
+            self.log.info("Stored API client credentials were rejected, creating a new API client.")
+            return False
+        self.log.info(
+            "Stored API client credentials are valid, skipping API role and client creation."
+        )
+        return True
+
     async def _configure_integration(
         self, basic_token: str, jamf_url: str
     ) -> Optional[Tuple[str, str]]:
         """Creates API Role and Client for standard setup types."""
-        api_client = BaseAPIClient()
+        api_client = self.api_client
+        # Role and client creation cannot be gathered; the client's authorization scope
+        # references the role by name, so the role must exist before the client is created.
         if not await api_client.create_roles(token=basic_token, jamf_url=jamf_url):
             self.log.error(
                 "Failed to create API role as expected during setup. Verify SSO is not being used in Jamf instance."
@@ -205,92 +393,115 @@ class Setup:
                 )
 
     async def _run_setup(self, setup_type: SetupType, animator: Optional[Animation] = None) -> None:
-        """Handles both types of setup for end-users based on passed `setup_type`."""
-        if self.completed:
-            return
+        """
+        Handles both types of setup for end-users based on passed `setup_type`.
 
+        Only called by ``start``, which has already returned if setup was completed.
+        """
         # Setup animation
         animator = animator or self.animator
 
-        # Prompt for credentials
-        creds = self._prompt_credentials(setup_type)
-
         if setup_type == SetupType.STANDARD:
             # `launch` method
             self.log.debug(
                 "Detected first run has not been completed. Starting standard (non-SSO) Setup..."
             )
 
-            # Validate needed credentials are present
+            # Prompt for the URL first, username and password are only needed for a new integration
+            jamf_url = self._prompt_url()
             await animator.update_msg("Starting Standard setup...")
-            self._validate_creds(creds, ("USERNAME", "PASSWORD", "URL"), setup_type)
-
-            # Extract jamf_url
-            jamf_url = creds.get("URL")
-
-            # Retrieve basic token
-            await animator.update_msg("Retrieving basic token")
-            basic_token = await self._token_fetching(setup_type=SetupType.STANDARD, creds=creds)
 
-            # Create API Role and Client
-            await animator.update_msg("Creating API integrations")
-            client_id, client_secret = await self._configure_integration(
-                basic_token=basic_token, jamf_url=jamf_url
-            )
+            # Setup may be re-run against a server it was already completed for, the API role
+            # and client from that run are reused if they still work. The host lookup runs while
+            # the keychain is read and, without a stored client, the remaining credentials typed.
+            creds = None
+            client = await asyncio.to_thread(self._stored_client, jamf_url)
+            if client is None:
+                async with animator.paused():
+                    creds = self._prompt_credentials(setup_type, jamf_url=jamf_url)
+            await self._wait_for_host_lookup()
+
+            if client is not None:
+                await animator.update_msg("Checking for existing API integration")
+                if not await self._existing_integration(client):
+                    client = None
+
+            if client is not None:
+                client_creds = None  # Stored, and an AccessToken was already fetched
+            else:
+                # Stored credentials were rejected, prompt for the remaining credentials now
+                if creds is None:
+                    async with animator.paused():
+                        creds = self._prompt_credentials(setup_type, jamf_url=jamf_url)
+                self._validate_creds(creds, setup_type)
+
+                # Retrieve basic token
+                await animator.update_msg("Retrieving basic token")
+                basic_token = await self._fetch_basic_token(creds, animator=animator)
+
+                # Create API Role and Client
+                await animator.update_msg("Creating API integrations")
+                client_id, client_secret = await self._configure_integration(
+                    basic_token=basic_token, jamf_url=jamf_url
+                )
 
-            # Save credentials
-            client_creds = {"URL": jamf_url, "CLIENT_ID": client_id, "CLIENT_SECRET": client_secret}
-            self._save_creds(client_creds)
-
-            # Retrieve AccessToken
-            await animator.update_msg("Fetching AccessToken")
-            token = await self._token_fetching(setup_type=SetupType.SSO, creds=client_creds)
-
-            # Setup JamfClient
-            await animator.update_msg("Creating JamfClient...")
-            self.config.create_client(
-                JamfClient(
-                    client_id=client_id,
-                    client_secret=client_secret,
-                    server=jamf_url,
-                ),
-                token=token,
-            )
+                client_creds = {
+                    "URL": jamf_url,
+                    "CLIENT_ID": client_id,
+                    "CLIENT_SECRET": client_secret,
+                }
+                client = JamfClient(
+                    client_id=client_id, client_secret=client_secret, server=jamf_url
+                )
         elif setup_type == SetupType.SSO:
             # `first_run` method
             self.log.debug("Detected first run has not been completed. Starting SSO setup...")
 
+            # Prompt for credentials, the host lookup runs while they are typed
+            creds = self._prompt_credentials(setup_type)
+            await self._wait_for_host_lookup()
+
             # Ensure client ID and client secret are present in credentials
             await animator.update_msg("Starting SSO setup...")
-            self._validate_creds(creds, ("CLIENT_ID", "CLIENT_SECRET", "URL"), setup_type)
-
-            # Store credentials
-            await animator.update_msg("Saving credentials...")
-            self._save_creds(creds)
-
-            # Fetch token
-            await animator.update_msg("Fetching AccessToken...")
-            token = await self._token_fetching(setup_type=SetupType.SSO, creds=creds)
-
-            # Setup JamfClient
-            await animator.update_msg("Creating JamfClient...")
-            self.config.create_client(
-                JamfClient(
-                    client_id=creds.get("CLIENT_ID"),
-                    client_secret=creds.get("CLIENT_SECRET"),
-                    server=creds.get("URL"),
-                ),
-                token=token,
+            self._validate_creds(creds, setup_type)
+
+            client_creds = creds
+            client = JamfClient(
+                client_id=creds.get("CLIENT_ID"),
+                client_secret=creds.get("CLIENT_SECRET"),
+                server=creds.get("URL"),
             )
 
+        if client_creds is not None:
+            # Fetch AccessToken in background while credentials are saved
+            token_task = asyncio.create_task(
+                self._token_fetching(setup_type=SetupType.SSO, client=client)
+            )
+
+            try:
+                # Store credentials
+                await animator.update_msg("Saving credentials...")
+                await self._save_creds(client_creds)
+
+                # Wait for the AccessToken before prompting, so rejected credentials are reported
+                # before any UI questions. TokenManager saves it to the keychain.
+                await animator.update_msg("Retrieving AccessToken")
+                await token_task
+            except BaseException:
+                # Wait for the cancelled request to unwind before re-raising. A keychain write the
+                # token task already started in a worker thread still completes.
+                token_task.cancel()
+                await asyncio.gather(token_task, return_exceptions=True)
+                raise
+
         # Set stop event before prompting
         await animator.stop()
 
         # Setup UI components
         self.ui_config.setup_ui()
 
-        # Mark setup as complete
-        self._mark_completion(value=True)
+        # Mark setup as complete; plist I/O runs in a worker thread to keep the event loop free
+        await asyncio.to_thread(self._mark_completion, value=True)
 
     async def start(self, animator: Optional[Animation] = None) -> None:
         """
@@ -319,15 +530,15 @@ class Setup:
 
         animator = animator or self.animator
 
-        setup_type_map = {1: SetupType.STANDARD, 2: SetupType.SSO}
-        choice = click.prompt(
-            "Choose setup method (1: Standard setup, 2: SSO setup)", type=int, default=1
-        )
-        if choice in setup_type_map:
-            await self._run_setup(setup_type_map[choice], animator=animator)
-        else:
+        while True:
+            choice = click.prompt(
+                "Choose setup method (1: Standard setup, 2: SSO setup)", type=int, default=1
+            )
+            if choice in self._SETUP_TYPE_MAP:
+                break
             click.echo(click.style("Invalid choice, please choose 1 or 2", fg="red"))
-            await self.start()
+
+        await self._run_setup(self._SETUP_TYPE_MAP[choice], animator=animator)
 
     def reset_setup(self) -> bool:
         """
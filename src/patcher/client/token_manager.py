@@ -1,6 +1,8 @@
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Dict, Optional
+from urllib.parse import urlencode
 
 from pydantic import ValidationError
 
@@ -13,7 +15,19 @@ from .config_manager import ConfigManager
 
 
 class TokenManager:
-    def __init__(self, config: ConfigManager):
+    # Jamf Pro OAuth endpoint and headers for client credentials token requests
+    _TOKEN_PATH = "/api/oauth/token"
+    _TOKEN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+    # Seconds to wait before retrying a failed background refresh
+    _REFRESH_RETRY_DELAY = 30
+
+    def __init__(
+        self,
+        config: ConfigManager,
+        client: Optional[JamfClient] = None,
+        api_client: Optional[BaseAPIClient] = None,
+        refresh_window: int = 120,
+    ):
         """
         The ``TokenManager`` class handles all operations related to the token lifecycle, including fetching,
         saving, and validating the access token.
@@ -23,12 +37,26 @@ class TokenManager:
 
         :param config: A ``ConfigManager`` instance for managing credentials and configurations.
         :type config: :class:`~patcher.client.config_manager.ConfigManager`
+        :param client: An already validated ``JamfClient``. If omitted, the client is loaded from the keychain on first use.
+        :type client: :py:obj:`~typing.Optional` [:class:`~patcher.models.jamf_client.JamfClient`]
+        :param api_client: A ``BaseAPIClient`` to send token requests with. If omitted, a new instance is created.
+        :type api_client: :py:obj:`~typing.Optional` [:class:`~patcher.client.BaseAPIClient`]
+        :param refresh_window: Seconds before a token is considered expired in which it is refreshed
+            in the background, so API calls do not wait on the refresh. Capped at half of the token's
+            remaining lifetime when it is first used. Defaults to ``120``.
+        :type refresh_window: :py:class:`int`
         """
         self.log = LogMe(self.__class__.__name__)
         self.config = config
-        self.api_client = BaseAPIClient()
-        self._client = None  # lazy load creds
+        self.api_client = api_client or BaseAPIClient()
+        self._client = client  # lazy load creds when not provided
         self._token = None
+        # (url, encoded form body), built from the JamfClient on first fetch
+        self._token_request = None
+        self._valid_until = 0.0  # Epoch time the cached token needs no refresh until
+        self._refresh_at = 0.0  # Epoch time the background refresh of the cached token starts
+        self.refresh_window = refresh_window
+        self._refresh_task = None  # Background refresh started by ensure_valid_token
         self.lock = asyncio.Lock()
 
     @property
@@ -44,12 +72,9 @@ class TokenManager:
         if not self._token:
             self.log.debug("Attempting to load AccessToken.")
             try:
-                self._token = self.load_token()
+                self._token = self.load_token()  # Logs the load, ensure_valid_token logs the token
             except CredentialError:
                 self.log.warning("Failed to load token from keychain.")
-            self.log.info(
-                f"Token ending in {self._token.token[-4:]}  loaded successfully from JamfClient."
-            )
         return self._token
 
     def load_token(self) -> AccessToken:
@@ -109,18 +134,22 @@ class TokenManager:
         :raises TokenError: If a token cannot be retrieved from the Jamf API.
         """
         self.log.debug("Attempting to fetch new AccessToken.")
-        url = f"{self.client.base_url}/api/oauth/token"
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        data = {
-            "client_id": self.client.client_id,
-            "grant_type": "client_credentials",
-            "client_secret": self.client.client_secret,
-        }
+        if self._token_request is None:
+            self._token_request = (
+                f"{self.client.base_url}{self._TOKEN_PATH}",
+                urlencode(
+                    {
+                        "client_id": self.client.client_id,
+                        "grant_type": "client_credentials",
+                        "client_secret": self.client.client_secret,
+                    }
+                ),
+            )
+        url, data = self._token_request
 
         try:
             response = await self.api_client.fetch_json(
-                url, headers=headers, method="POST", data=data
+                url, headers=self._TOKEN_HEADERS, method="POST", data=data
             )
             self.log.info("Received valid response from Jamf API for AccessToken call.")
         except APIResponseError as e:
@@ -131,7 +160,11 @@ class TokenManager:
                 error_msg=str(e),
             )
 
-        return self._parse_token_response(response)
+        access_token = self._parse_token_response(response)
+
+        await self._save_token(access_token)
+        self.log.info("New token fetched and saved successfully")
+        return access_token
 
     def _parse_token_response(self, response: Dict) -> AccessToken:
         """
@@ -142,22 +175,31 @@ class TokenManager:
         :type response: :py:obj:`~typing.Dict`
         :return: The extracted ``AccessToken`` object.
         :rtype: :class:`~patcher.models.token.AccessToken`
+        :raises TokenError: If the response is missing the token or a positive ``expires_in`` value.
         """
         self.log.debug("Attempting to parse API response for AccessToken.")
         token = response.get("access_token")
         expires_in = response.get("expires_in")
 
-        expiration = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
-        access_token = AccessToken(token=token, expires=expiration)
+        if not (token and isinstance(token, str)) or not (
+            isinstance(expires_in, int) and expires_in > 0
+        ):
+            self.log.error("Jamf API token response is missing the token or its lifetime.")
+            raise TokenError(
+                "Invalid AccessToken response received from Jamf instance.",
+                expires_in=expires_in,
+            )
 
-        self._save_token(token=access_token)
-        self.log.info("New token fetched and saved successfully")
-        return access_token
+        expiration = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        return AccessToken(token=token, expires=expiration)
 
-    def _save_token(self, token: AccessToken):
+    async def _save_token(self, token: AccessToken):
         """
         This method stores the access token and its expiration date in the keyring
-        for later retrieval. It also updates the ``JamfClient`` instance with the new token.
+        for later retrieval. The token is also cached, so it is not loaded from the keyring again.
+
+        Keychain writes block, so only the write runs in a worker thread. The cache is updated
+        on the event loop afterwards, so ``ensure_valid_token`` never sees it half updated.
 
         :param token: The ``AccessToken`` instance containing the token and its expiration date.
         :type token: :class:`~patcher.models.token.AccessToken`
@@ -165,15 +207,37 @@ class TokenManager:
         """
         self.log.debug("Attempting to save retrieved AccessToken object.")
         try:
-            self.config.set_credential("TOKEN", token.token)
-            self.config.set_credential("TOKEN_EXPIRATION", token.expires.isoformat())
+            await asyncio.to_thread(
+                self.config.set_credentials,
+                {"TOKEN": token.token, "TOKEN_EXPIRATION": token.expires.isoformat()},
+            )
         except CredentialError as e:
             self.log.error(f"Unable to save AccessToken object to keychain. Details: {e}")
             raise TokenError("Unable to save AccessToken object to keychain.", error_msg=str(e))
 
-        self._token = None  # clear cache; force reload on next access
+        self._token = token  # keep the saved token, no need to read it back from the keychain
+        self._valid_until = 0.0
+        self._refresh_at = 0.0
         self.log.info("AccessToken object updated in keychain")
 
+    async def _refresh_early(self, token: AccessToken) -> None:
+        """
+        Fetches a new token ahead of expiration of ``token``. Failures are only logged, as the
+        current token is still valid; the refresh is retried after ``_REFRESH_RETRY_DELAY``
+        seconds, or by ``ensure_valid_token`` once the token expired.
+        """
+        try:
+            async with self.lock:
+                # Skip if the token was already replaced while waiting on the lock
+                if self._token is token:
+                    self.log.debug("Bearer token expires soon, refreshing in background.")
+                    await self.fetch_token()
+        except Exception as e:
+            self.log.warning(f"Background token refresh failed. Details: {e}")
+            self._valid_until = min(token.valid_until, time.time() + self._REFRESH_RETRY_DELAY)
+        finally:
+            self._refresh_task = None
+
     async def ensure_valid_token(self) -> AccessToken:
         """
         Verifies the current access token is valid (present and not expired).
@@ -183,15 +247,37 @@ class TokenManager:
             The :meth:`~patcher.utils.decorators.check_token` decorator leverages
             this method with thread locking to ensure tokens are valid before API calls.
 
+        The lock is only acquired when a refresh is needed, so callers holding a valid token
+        never wait on each other. Once a token has been verified, later calls only compare the
+        current time against its expiration until it needs refreshing.
+
+        Tokens within ``refresh_window`` seconds of expiring are still returned, while a new token
+        is fetched in the background. Callers only wait on a refresh if the token already expired.
+        The window is capped at half the remaining lifetime of a token when it is first used, so
+        short-lived tokens are not refreshed on every call.
+
         :return: The ``AccessToken`` object by way of ``self.token`` property.
         :rtype: :class:`~patcher.models.token.AccessToken`
         """
-        async with self.lock:
-            if self.token.is_expired:
-                self.log.warning("Bearer token is invalid or expired, attempting to refresh...")
-                await self.fetch_token()
+        if time.time() < self._valid_until:
+            return self._token
 
-            self.log.info(
-                f"Token ending in ({self.token.token[-4:]}) retrieved successfully. Remaining seconds: {self.token.seconds_remaining}"
-            )
-            return self.token
+        if self.token.is_expired:
+            async with self.lock:
+                # Re-check once the lock is held, a concurrent caller may have refreshed already
+                if self.token.is_expired:
+                    self.log.warning("Bearer token is invalid or expired, attempting to refresh...")
+                    await self.fetch_token()
+
+        token = self.token
+        now = time.time()
+        if not self._refresh_at:
+            lifetime = max(token.valid_until - now, 0.0)
+            self._refresh_at = token.valid_until - min(self.refresh_window, lifetime / 2)
+        self._valid_until = self._refresh_at
+        if now >= self._valid_until and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_early(token))
+        self.log.debug(
+            f"Token ending in ({token.token[-4:]}) retrieved successfully. Remaining seconds: {token.seconds_remaining}"
+        )
+        return token
@@ -1,10 +1,10 @@
-import plistlib
+import copy
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, Optional, Set, Tuple, Union
 
 import asyncclick as click
-from PIL import Image
 
 from ..utils.exceptions import PatcherError, SetupError, ShellCommandError
 from ..utils.logger import LogMe
@@ -43,8 +43,10 @@ class UIConfigManager:
         )
         self.font_dir = self.plist_path.parent / "fonts"
         self._fonts_saved = None
-        self.api = BaseAPIClient()
+        self._api = None  # Lazy-loaded, only needed to download fonts
         self._config = None  # Lazy-loaded
+        self._plist_cache = None  # (st_mtime_ns, parsed plist) of last read/write
+        self._verified_dirs: Set[Path] = set()  # Directories already known to exist
 
         self._ensure_directory(self.plist_path.parent)
 
@@ -88,7 +90,21 @@ class UIConfigManager:
             )
         self._config.update(kwargs)
         self.log.debug(f"Updated configuration: {self._config}")
-        self._write_plist_file({"UI": self._config})
+        plist_data = self._load_plist_file()  # Preserve other sections (e.g., Setup)
+        plist_data["UI"] = self._config
+        self._write_plist_file(plist_data)
+
+    @property
+    def api(self) -> BaseAPIClient:
+        """
+        The :class:`~patcher.client.BaseAPIClient` used to download the default fonts.
+
+        :return: The ``BaseAPIClient`` instance.
+        :rtype: :class:`~patcher.client.BaseAPIClient`
+        """
+        if self._api is None:
+            self._api = BaseAPIClient()
+        return self._api
 
     @property
     def fonts_present(self) -> bool:
@@ -107,6 +123,8 @@ class UIConfigManager:
 
     def _ensure_directory(self, path: Path) -> None:
         """Ensures the given directory exists and creates it if it does not."""
+        if path in self._verified_dirs:
+            return
         self.log.debug(f"Validating {path} exists.")
         if not path.exists():
             self.log.info(f"Creating directory: {path}")
@@ -122,6 +140,7 @@ class UIConfigManager:
                     parent_path=path.parent,
                     error_msg=str(e),
                 )
+        self._verified_dirs.add(path)
 
     def _load_plist_file(self) -> Dict:
         """
@@ -130,54 +149,106 @@ class UIConfigManager:
 
         If an error is raised trying to read the property list values, a warning is logged
         and an empty dictionary is returned.
+
+        The parsed contents are cached alongside the file's modification time, so the file is
+        only parsed again when it has changed on disk.
         """
-        if not self.plist_path.exists():
-            return {}
         try:
+            mtime_ns = self.plist_path.stat().st_mtime_ns  # Also serves as the existence check
+            if self._plist_cache is not None and self._plist_cache[0] == mtime_ns:
+                return copy.deepcopy(self._plist_cache[1])
+            import plistlib  # Deferred to keep it off the CLI import path
+
             with self.plist_path.open("rb") as plistfile:
-                return plistlib.load(plistfile)
+                plist_data = plistlib.load(plistfile)
+            self._plist_cache = (mtime_ns, copy.deepcopy(plist_data))
+            return plist_data
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             self.log.warning(f"Failed to load plist file. Details: {e}")
             return {}
 
     def _write_plist_file(self, plist_data: Dict) -> None:
-        """Writes specified data to Patcher property list file."""
+        """
+        Writes specified data to Patcher property list file.
+
+        Data is written to a temporary file first and moved into place, so an interrupted
+        write never leaves a truncated property list behind.
+        """
         self._ensure_directory(self.plist_path.parent)
+        tmp_path = self.plist_path.with_name(f"{self.plist_path.name}.tmp")
         try:
-            with self.plist_path.open("wb") as plistfile:
+            import plistlib
+
+            with tmp_path.open("wb") as plistfile:
                 plistlib.dump(plist_data, plistfile)
+            os.replace(tmp_path, self.plist_path)
+            self._cache_written(plist_data)
             self.log.info(f"Configuration saved to {self.plist_path}")
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             self.log.error(f"Failed to write plist file. Details: {e}")
             raise PatcherError(
                 "Could not write to plist file.", path=self.plist_path, error_msg=str(e)
             )
 
-    def _download_font(self, url: str, dest_path: Path):
+    def _cache_written(self, plist_data: Dict) -> None:
+        """Caches data just written to the property list so it is not parsed again on next load."""
+        try:
+            self._plist_cache = (self.plist_path.stat().st_mtime_ns, copy.deepcopy(plist_data))
+        except OSError:
+            self._plist_cache = None
+
+    @staticmethod
+    def _copy_if_changed(src: Path, dest: Path) -> None:
         """
-        Downloads the Assistant font family from the specified URL to the given destination path.
+        Copies ``src`` to ``dest`` unless ``dest`` already is, or is an up to date copy of, ``src``.
+
+        Only the file contents are copied (no permission bits or flags), then the source
+        modification time is applied to the copy, so matching size and modification time
+        indicate the file was copied on a previous run.
+        """
+        src_stat = None
+        try:
+            src_stat = os.stat(src)
+            dest_stat = os.stat(dest)
+            if os.path.samestat(src_stat, dest_stat) or (
+                src_stat.st_size == dest_stat.st_size
+                and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+            ):
+                return
+        except OSError:
+            pass  # Destination missing or unreadable, copy below surfaces any real error
+        shutil.copyfile(src, dest)
+        src_stat = src_stat or os.stat(src)
+        os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+    def _download_fonts(self, downloads: Dict[str, Path]):
+        """
+        Downloads several font files with a single curl invocation. Transfers run concurrently
+        (``--parallel``) instead of one curl process after the other.
 
         .. note:
             This API call is intentionally kept separate from the :class:`~patcher.client.api_client.ApiClient` class as
             the scope of this API call is solely for UI purposes.
 
-        :param url: The URL to download the font from.
-        :type url: :py:class:`str`
-        :param dest_path: The local path where the downloaded font should be saved.
-        :type dest_path: :py:obj:`~pathlib.Path`
-        :raises ShellCommandError: Raised if the font cannot be downloaded due to a network error or invalid response.
-        :raises PatcherError: If the destination path's parent cannot be created.
+        :param downloads: Mapping of font URLs to the local paths they should be saved to.
+        :type downloads: :py:obj:`~typing.Dict` [:py:class:`str`, :py:obj:`~pathlib.Path`]
+        :raises PatcherError: If any of the fonts cannot be downloaded.
         """
-        command = ["/usr/bin/curl", "-sL", url, "-o", str(dest_path)]
-        self.log.debug(f"Attempting to download default font family from {url} to {str(dest_path)}")
+        command = ["/usr/bin/curl", "-sL", "--parallel"]
+        for url, dest_path in downloads.items():
+            command.extend([url, "-o", str(dest_path)])
+        self.log.debug(f"Attempting to download {len(downloads)} font files to {self.font_dir}")
         try:
             self.api.execute_sync(command)
-            self.log.info(f"Default fonts saved successfully to {dest_path}")
+            self.log.info(f"Default fonts saved successfully to {self.font_dir}")
         except ShellCommandError as e:
-            self.log.error(f"Unable to download font from {url}: {e}")
+            self.log.error(f"Unable to download fonts: {e}")
             raise PatcherError(
                 "Failed to download default font family.",
-                url=url,
+                url=", ".join(downloads),
                 error_msg=str(e),
             )
 
@@ -220,11 +291,15 @@ class UIConfigManager:
         # Ensure directory exists
         self._ensure_directory(self.font_dir)
 
-        # Download fonts if not already present
+        # Download fonts if not already present, both files are fetched concurrently
         if not self.fonts_present:
             try:
-                self._download_font(self._REGULAR_FONT_URL, self.font_dir / "Assistant-Regular.ttf")
-                self._download_font(self._BOLD_FONT_URL, self.font_dir / "Assistant-Bold.ttf")
+                self._download_fonts(
+                    {
+                        self._REGULAR_FONT_URL: self.font_dir / "Assistant-Regular.ttf",
+                        self._BOLD_FONT_URL: self.font_dir / "Assistant-Bold.ttf",
+                    }
+                )
             except (PatcherError, ShellCommandError):
                 raise  # Avoid chaining exception in this instance
 
@@ -272,7 +347,7 @@ class UIConfigManager:
         use_logo = click.confirm(
             "Would you like to use a logo in your exported PDFs?", default=False
         )
-        self.font_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_directory(self.font_dir)
 
         font_name, font_regular_path, font_bold_path = self.configure_font(
             use_custom_font, self.font_dir
@@ -314,8 +389,8 @@ class UIConfigManager:
             self.log.info("Font information gathered successfully.")
             try:
                 self.log.debug(f"Attempting to copy font information to {font_dir}")
-                shutil.copy(font_regular_src_path, font_regular_dest_path)
-                shutil.copy(font_bold_src_path, font_bold_dest_path)
+                self._copy_if_changed(font_regular_src_path, font_regular_dest_path)
+                self._copy_if_changed(font_bold_src_path, font_bold_dest_path)
                 self.log.info(f"Font information copied to {font_dir} successfully.")
             except (
                 OSError,
@@ -346,6 +421,9 @@ class UIConfigManager:
         Similar to :meth:`~patcher.client.ui_manager.UIConfigManager.configure_font` this method is
         solely used in conjunction with the :class:`~patcher.client.setup.Setup` class.
 
+        The property list is not written here; :meth:`~patcher.client.ui_manager.UIConfigManager.save_ui_config`
+        stores the returned path along with the other UI settings in a single write.
+
         :param use_logo: Indicates whether or not to use a custom logo.
         :type use_logo: :py:class:`bool`
         :return: The path to the saved logo file, or None if no logo is configured.
@@ -358,6 +436,9 @@ class UIConfigManager:
             self.log.info("Skipping logo configuration...")
             return None
 
+        # Pillow is only needed to validate logos, defer its import until one is configured
+        from PIL import Image
+
         self.log.debug("Attempting to configure optional branding logo.")
         logo_dest_path = self.plist_path.parent / "logo.png"
 
@@ -386,7 +467,7 @@ class UIConfigManager:
         # Copy file
         try:
             self.log.debug(f"Attempting to copy logo file to {logo_dest_path}")
-            shutil.copy(logo_src_path, logo_dest_path)
+            self._copy_if_changed(logo_src_path, logo_dest_path)
             self.log.info(f"Logo saved to {logo_dest_path}.")
         except (
             FileNotFoundError,
@@ -403,14 +484,7 @@ class UIConfigManager:
                 error_msg=str(e),
             )
 
-        # Save logo path in config
-        self.config["LOGO_PATH"] = str(logo_dest_path)
-
-        # Update plist file
-        plist_data = self._load_plist_file()
-        plist_data["UI"] = self.config
-        self._write_plist_file(plist_data)
-
+        # The returned path is written with the rest of the UI settings by ``save_ui_config``
         return str(logo_dest_path)
 
     def save_ui_config(
@@ -445,7 +519,7 @@ class UIConfigManager:
         plist_data = self._load_plist_file()
 
         self.log.debug("Attempting to save UI configuration settings.")
-        plist_data["UI"] = {
+        ui_config = {
             "HEADER_TEXT": header_text,
             "FOOTER_TEXT": footer_text,
             "FONT_NAME": font_name,
@@ -453,7 +527,11 @@ class UIConfigManager:
             "FONT_BOLD_PATH": str(font_bold_path),
             "LOGO_PATH": str(logo_path) if logo_path else "",
         }
+        plist_data["UI"] = ui_config
         self._write_plist_file(plist_data)
+
+        # Keep in-memory settings in sync so ``config`` does not re-read the file
+        self._config = ui_config
         self.log.info("Saved UI configuration settings successfully.")
 
     def get_logo_path(self) -> Union[str, None]:
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 
 from pydantic import Field
 
@@ -30,6 +31,17 @@ class AccessToken(Model):
         """
         return self.token
 
+    @property
+    def valid_until(self) -> float:
+        """
+        The time (in epoch seconds) after which the token is considered expired, 60 seconds
+        before its actual expiration.
+
+        :return: The epoch timestamp the token is valid until.
+        :rtype: :py:class:`float`
+        """
+        return self.expires.timestamp() - 60
+
     @property
     def is_expired(self) -> bool:
         """
@@ -40,7 +52,7 @@ class AccessToken(Model):
         :return: ``True`` if the token is expired.
         :rtype: :py:class:`bool`
         """
-        return self.expires - timedelta(seconds=60) < datetime.now(timezone.utc)
+        return self.valid_until < time.time()
 
     @property
     def seconds_remaining(self) -> int:
@@ -51,4 +63,4 @@ class AccessToken(Model):
         :return: The number of seconds remaining until the token expires.
         :rtype: :py:class:`int`
         """
-        return max(0, int((self.expires - datetime.now(timezone.utc)).total_seconds()))
+        return max(0, int(self.expires.timestamp() - time.time()))
@@ -62,6 +62,18 @@ class Animation:
             click.echo(clear_message, nl=False)
             self.message_template = new_message_template
 
+    @asynccontextmanager
+    async def paused(self):
+        """
+        Context manager to hold the spinner while prompting for input.
+
+        The current spinner line is cleared on entering the context, and no frames are drawn
+        until it exits, so prompts are not written on (or overwritten by) the spinner line.
+        """
+        async with self.lock:
+            click.echo("\r" + " " * self.last_message_length + "\r", nl=False)
+            yield
+
     async def _animate(self):
         """
         Private method to handle the actual animation of the spinner, cycling through
@@ -58,7 +58,9 @@ class PatcherLog:
                 console_handler.setLevel(logging.DEBUG)
                 logger.addHandler(console_handler)
 
-            logger.setLevel(logging.DEBUG)  # Capture all messages, delegate to handlers
+            # Capture everything the handlers accept; without the console handler DEBUG records
+            # would only be built to be discarded by the file handler
+            logger.setLevel(logging.DEBUG if debug else (level or PatcherLog.LOG_LEVEL))
 
         return logger
 
@@ -147,6 +149,11 @@ class LogMe:
         """Check if any logger handlers are set to debug level."""
         return any(h.level == logging.DEBUG for h in self.logger.handlers)
 
+    @property
+    def debug_enabled(self) -> bool:
+        """Check if debug messages are emitted, so costly debug messages can be skipped."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def debug(self, msg: str):
         self.logger.debug(msg)
         if self.is_debug:
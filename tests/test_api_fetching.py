@@ -79,3 +79,25 @@ async def test_get_summaries_error(api_client):
     with patch("asyncio.create_subprocess_exec", return_value=mock_process):
         with pytest.raises(exceptions.APIResponseError):
             await api_client.get_summaries(["1", "2", "3"])
+
+
+@pytest.mark.asyncio
+async def test_headers_reused_for_same_token(api_client, mock_access_token):
+    api_client.token_manager.ensure_valid_token = AsyncMock()
+    api_client.token_manager._token = mock_access_token
+
+    headers = await api_client._headers()
+    assert headers["Authorization"] == "Bearer mocked_token"
+    assert await api_client._headers() is headers
+
+    # A refreshed token produces new headers
+    api_client.token_manager._token = mock_access_token.model_copy(update={"token": "new_token"})
+    assert (await api_client._headers())["Authorization"] == "Bearer new_token"
+
+
+def test_token_manager_shares_api_client(api_client):
+    assert api_client.token_manager.api_client is api_client
+
+
+def test_jamf_client_attached_once(api_client):
+    assert api_client.token_manager.client is api_client.jamf_client
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from src.patcher.utils import exceptions
@@ -50,6 +50,38 @@ async def test_execute_failure(base_api_client):
             await base_api_client.execute(command)
 
 
+@pytest.mark.asyncio
+async def test_execute_skips_sanitizing_without_debug(base_api_client):
+    mock_process = AsyncMock()
+    mock_process.communicate.return_value = (b"output", b"")
+    mock_process.returncode = 0
+
+    with (
+        patch("asyncio.create_subprocess_exec", return_value=mock_process),
+        patch.object(base_api_client.log.logger, "isEnabledFor", return_value=False),
+        patch.object(base_api_client, "_sanitize_command") as mock_sanitize,
+    ):
+        await base_api_client.execute(["echo", "test"])
+        mock_sanitize.assert_not_called()
+
+
+def test_execute_sync_skips_sanitizing_without_debug(base_api_client):
+    with (
+        patch("subprocess.run", return_value=MagicMock(stdout=b"output")),
+        patch.object(base_api_client.log.logger, "isEnabledFor", return_value=False),
+        patch.object(base_api_client, "_sanitize_command") as mock_sanitize,
+    ):
+        base_api_client.execute_sync(["echo", "test"])
+        mock_sanitize.assert_not_called()
+
+
+def test_command_str_redacts_credentials(base_api_client):
+    command = ["/usr/bin/curl", "-u", "user:pass", "-d", "client_secret=secret"]
+    assert base_api_client._command_str(command) == (
+        "/usr/bin/curl -u <REDACTED_CREDENTIAL> -d client_secret=<REDACTED_CREDENTIAL>"
+    )
+
+
 # Test HTTP Status code handling
 def test_handle_status_code_success(base_api_client):
     response_json = {"data": "test"}
@@ -102,13 +134,23 @@ async def test_fetch_batch(base_api_client):
 @pytest.mark.asyncio
 async def test_fetch_basic_token(base_api_client):
     with patch.object(
-        base_api_client, "execute", AsyncMock(return_value='{"token": "abc123"}')
+        base_api_client, "execute", AsyncMock(return_value='{"token": "abc123"}\nSTATUS:200')
     ) as mock_execute:
         result = await base_api_client.fetch_basic_token("user", "pass", "https://example.com")
         assert result == "abc123"
         mock_execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_fetch_basic_token_non_json(base_api_client):
+    with patch.object(
+        base_api_client, "execute", AsyncMock(return_value="<html>401</html>\nSTATUS:401")
+    ):
+        with pytest.raises(exceptions.APIResponseError) as excinfo:
+            await base_api_client.fetch_basic_token("user", "pass", "https://example.com")
+        assert excinfo.value.context["status_code"] == 401
+
+
 @pytest.mark.asyncio
 async def test_create_roles(base_api_client):
     with patch.object(
@@ -136,3 +178,25 @@ async def test_create_client(base_api_client):
         result = await base_api_client.create_client("token", "https://example.com")
         assert result == ("123", "secret")
         assert mock_execute.call_count == 2
+
+
+def test_setup_headers_reused_for_same_token(base_api_client):
+    headers = base_api_client._setup_headers("token")
+    assert headers["Authorization"] == "Bearer token"
+    assert base_api_client._setup_headers("token") is headers
+    assert base_api_client._setup_headers("new_token")["Authorization"] == "Bearer new_token"
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_form_data_encoded(base_api_client):
+    with patch.object(
+        base_api_client, "execute", AsyncMock(return_value='{"ok": true}\nSTATUS:200')
+    ) as mock_execute:
+        await base_api_client.fetch_json(
+            "https://example.com",
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            method="POST",
+            data={"client_id": "abc", "client_secret": "a+b&c"},
+        )
+        command = mock_execute.call_args.args[0]
+        assert command[command.index("-d") + 1] == "client_id=abc&client_secret=a%2Bb%26c"
@@ -38,6 +38,14 @@ def test_set_credential_failure(real_config_manager):
         assert "Unable to save credential as expected" in str(excinfo.value)
 
 
+def test_set_credentials_success(real_config_manager):
+    with patch("keyring.set_password") as mock_set_password:
+        real_config_manager.set_credentials({"URL": "https://mocked.url", "CLIENT_ID": "id"})
+        mock_set_password.assert_any_call("TestService", "URL", "https://mocked.url")
+        mock_set_password.assert_any_call("TestService", "CLIENT_ID", "id")
+        assert mock_set_password.call_count == 2
+
+
 def test_delete_credential_success(real_config_manager):
     with patch("keyring.delete_password") as mock_delete_password:
         result = real_config_manager.delete_credential("API_KEY")
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import plistlib
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -8,7 +10,8 @@ from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 import pytest
 from src.patcher.client.setup import Setup, SetupType
 from src.patcher.models.token import AccessToken
-from src.patcher.utils.exceptions import SetupError
+from src.patcher.utils.animation import Animation
+from src.patcher.utils.exceptions import PatcherError, SetupError
 
 
 @pytest.fixture
@@ -20,8 +23,11 @@ def setup_instance(
     temp_plist_path = Path(temp_plist.name)
     temp_plist.close()
 
-    # Mock plist_path to use temp file
-    with patch.object(ui_config, "plist_path", new=temp_plist_path):
+    # Mock plist_path to use temp file, and keep host lookups started by prompts off the network
+    with (
+        patch.object(ui_config, "plist_path", new=temp_plist_path),
+        patch("socket.getaddrinfo", return_value=[]),
+    ):
         instance = Setup(
             config=config_manager,
             ui_config=ui_config,
@@ -51,7 +57,7 @@ async def test_init(setup_instance, config_manager, ui_config):
 def test_is_complete(setup_instance):
     with (
         patch.object(Path, "exists", return_value=True),
-        patch("plistlib.load", return_value={"Setup": {"first_run_done": True}}),
+        patch("plistlib.loads", return_value={"Setup": {"first_run_done": True}}),
         patch("builtins.open", mock_open(read_data=b"")),
     ):
         result = setup_instance._check_completion()
@@ -60,11 +66,19 @@ def test_is_complete(setup_instance):
 
 def test_is_complete_error(setup_instance):
     with patch.object(Path, "exists", return_value=True):
-        with patch("plistlib.load", side_effect=InvalidFileException("plist read error")):
+        with patch("plistlib.loads", side_effect=InvalidFileException("plist read error")):
             result = setup_instance._check_completion()
             assert result is False
 
 
+def test_is_complete_skips_plist_parse(setup_instance):
+    with open(setup_instance.plist_path, "wb") as fp:
+        fp.write(plistlib.dumps({"Setup": {"first_run_done": True}}))
+    with patch("plistlib.loads") as mock_loads:
+        assert setup_instance._check_completion() is True
+        mock_loads.assert_not_called()
+
+
 def test_setup_type_enum():
     assert SetupType.STANDARD.value == "standard"
     assert SetupType.SSO.value == "sso"
@@ -92,35 +106,81 @@ def test_prompt_credentials_sso(setup_instance):
         }
 
 
+@pytest.mark.asyncio
+async def test_resolve_host(setup_instance):
+    with patch("socket.getaddrinfo", return_value=[]) as mock_getaddrinfo:
+        await setup_instance._resolve_host("https://example.jamfcloud.com/")
+        mock_getaddrinfo.assert_called_once_with("example.jamfcloud.com", 443)
+
+
+def test_resolve_host_no_loop(setup_instance):
+    assert setup_instance._resolve_host("https://example.jamfcloud.com") is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_host_invalid_url(setup_instance):
+    assert setup_instance._resolve_host("https://[abc") is None
+
+
+@pytest.mark.asyncio
+async def test_run_setup_ignores_failed_host_lookup(setup_instance):
+    mock_token = AccessToken(token="mock_token", expires=datetime(2028, 1, 1, tzinfo=timezone.utc))
+    with (
+        patch(
+            "asyncclick.prompt",
+            side_effect=["https://jamf..example.com", "client_id", "client_secret"],
+        ),
+        patch("socket.getaddrinfo", side_effect=UnicodeError("label empty or too long")),
+        patch.object(setup_instance, "_token_fetching", return_value=mock_token),
+        patch.object(setup_instance, "_save_creds"),
+        patch.object(setup_instance, "_mark_completion"),
+        patch.object(setup_instance.animator, "update_msg"),
+        patch.object(setup_instance.animator.stop_event, "set"),
+    ):
+        await setup_instance._run_setup(SetupType.SSO)
+        setup_instance._mark_completion.assert_called_once_with(value=True)
+
+
 def test_validate_creds_success(setup_instance):
     creds = {"URL": "https://example.com", "USERNAME": "user", "PASSWORD": "pass"}
-    setup_instance._validate_creds(creds, ("URL", "USERNAME", "PASSWORD"), SetupType.STANDARD)
+    setup_instance._validate_creds(creds, SetupType.STANDARD)
 
 
 def test_validate_creds_missing_keys(setup_instance):
     creds = {"URL": "https://example.com"}
     with pytest.raises(SetupError) as excinfo:
-        setup_instance._validate_creds(creds, ("URL", "USERNAME", "PASSWORD"), SetupType.STANDARD)
+        setup_instance._validate_creds(creds, SetupType.STANDARD)
     assert "Missing required credentials." in str(excinfo.value)
 
 
-def test_save_creds(setup_instance):
+@pytest.mark.asyncio
+async def test_save_creds(setup_instance):
     creds = {"URL": "https://example.com", "USERNAME": "user", "PASSWORD": "pass"}
-    setup_instance._save_creds(creds)
-    setup_instance.config.set_credential.assert_any_call("URL", "https://example.com")
-    setup_instance.config.set_credential.assert_any_call("USERNAME", "user")
-    setup_instance.config.set_credential.assert_any_call("PASSWORD", "pass")
+    await setup_instance._save_creds(creds)
+    setup_instance.config.set_credentials.assert_called_once_with(creds)
 
 
 def test_mark_completion(setup_instance):
-    with (
-        patch("os.makedirs", MagicMock()),
-        patch("builtins.open", mock_open()) as mock_file,
-        patch("plistlib.dump") as mock_dump,
-    ):
+    setup_instance.ui_config._load_plist_file.return_value = {"UI": {"HEADER_TEXT": "Header"}}
+    setup_instance._mark_completion(value=True)
+    setup_instance.ui_config._write_plist_file.assert_called_once_with(
+        {"UI": {"HEADER_TEXT": "Header"}, "Setup": {"first_run_done": True}}
+    )
+    assert setup_instance.completed is True
+
+
+def test_mark_completion_write_error(setup_instance):
+    setup_instance.ui_config._load_plist_file.return_value = {}
+    setup_instance.ui_config._write_plist_file.side_effect = PatcherError("Could not write")
+    with pytest.raises(SetupError):
         setup_instance._mark_completion(value=True)
-        mock_file.assert_called_once_with(setup_instance.plist_path, "wb")
-        mock_dump.assert_called_once()
+
+
+def test_mark_completion_unchanged(setup_instance):
+    setup_instance.ui_config._load_plist_file.return_value = {"Setup": {"first_run_done": True}}
+    setup_instance._mark_completion(value=True)
+    setup_instance.ui_config._write_plist_file.assert_not_called()
+    assert setup_instance.completed is True
 
 
 @pytest.mark.asyncio
@@ -142,6 +202,238 @@ async def test_run_setup_standard(setup_instance):
         setup_instance._mark_completion.assert_called_once_with(value=True)
 
 
+@pytest.mark.asyncio
+async def test_run_setup_standard_existing_integration(setup_instance):
+    mock_token = AccessToken(token="mock_token", expires=datetime(2028, 1, 1, tzinfo=timezone.utc))
+    with (
+        patch("asyncclick.prompt", side_effect=["https://mocked.url/"]) as mock_prompt,
+        patch.object(setup_instance, "_token_fetching", return_value=mock_token) as mock_fetch,
+        patch.object(setup_instance, "_configure_integration") as mock_configure,
+        patch.object(setup_instance, "_save_creds") as mock_save,
+        patch.object(setup_instance, "_mark_completion"),
+        patch.object(setup_instance.animator, "update_msg"),
+        patch.object(setup_instance.animator.stop_event, "set"),
+    ):
+        await setup_instance._run_setup(SetupType.STANDARD)
+        mock_prompt.assert_called_once_with("Enter your Jamf Pro URL")
+        mock_fetch.assert_called_once()
+        assert mock_fetch.call_args.kwargs["client"].client_id == "mock_client_id"
+        mock_configure.assert_not_called()
+        mock_save.assert_not_called()
+        setup_instance._mark_completion.assert_called_once_with(value=True)
+
+
+@pytest.mark.asyncio
+async def test_run_setup_sso_token_error_before_ui_prompts(setup_instance):
+    with (
+        patch(
+            "asyncclick.prompt", side_effect=["https://example.com", "client_id", "client_secret"]
+        ),
+        patch.object(setup_instance, "_token_fetching", side_effect=SetupError("Rejected")),
+        patch.object(setup_instance, "_save_creds"),
+        patch.object(setup_instance, "_mark_completion"),
+        patch.object(setup_instance.animator, "update_msg"),
+        patch.object(setup_instance.animator.stop_event, "set"),
+    ):
+        with pytest.raises(SetupError):
+            await setup_instance._run_setup(SetupType.SSO)
+        setup_instance.ui_config.setup_ui.assert_not_called()
+        setup_instance._mark_completion.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_setup_sso_save_error_cancels_token_fetch(setup_instance):
+    fetch_cancelled = asyncio.Event()
+
+    async def pending_fetch(*args, **kwargs):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            fetch_cancelled.set()
+            raise
+
+    async def interrupted_save(creds):
+        await asyncio.sleep(0)  # let the token request start
+        raise KeyboardInterrupt
+
+    with (
+        patch(
+            "asyncclick.prompt", side_effect=["https://example.com", "client_id", "client_secret"]
+        ),
+        patch.object(setup_instance, "_token_fetching", side_effect=pending_fetch),
+        patch.object(setup_instance, "_save_creds", side_effect=interrupted_save),
+        patch.object(setup_instance, "_mark_completion"),
+        patch.object(setup_instance.animator, "update_msg"),
+        patch.object(setup_instance.animator.stop_event, "set"),
+    ):
+        with pytest.raises(KeyboardInterrupt):
+            await setup_instance._run_setup(SetupType.SSO)
+        assert fetch_cancelled.is_set()
+        setup_instance.ui_config.setup_ui.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_setup_standard_clears_spinner_before_prompts(setup_instance, mock_jamf_client):
+    events = []
+    answers = {
+        "Enter your Jamf Pro URL": "https://example.com",
+        "Enter your Jamf Pro username": "user",
+        "Enter your Jamf Pro password": "pass",
+    }
+
+    def prompt(text, **kwargs):
+        events.append(("prompt", text))
+        return answers[text]
+
+    async def slow_integration(client):
+        await asyncio.sleep(0.3)  # long enough for the spinner to draw
+        return False  # stored credentials rejected, username and password are prompted after
+
+    animator = Animation()
+    with (
+        patch("asyncclick.echo", side_effect=lambda msg="", **kwargs: events.append(("echo", msg))),
+        patch("asyncclick.prompt", side_effect=prompt),
+        patch.object(setup_instance, "_stored_client", return_value=mock_jamf_client),
+        patch.object(setup_instance, "_existing_integration", side_effect=slow_integration),
+        patch.object(setup_instance, "_fetch_basic_token", return_value="basic_token"),
+        patch.object(
+            setup_instance, "_configure_integration", return_value=("client_id", "client_secret")
+        ),
+        patch.object(setup_instance, "_token_fetching"),
+        patch.object(setup_instance, "_save_creds"),
+        patch.object(setup_instance, "_mark_completion"),
+    ):
+        await animator.start()
+        await setup_instance._run_setup(SetupType.STANDARD, animator=animator)
+
+    prompt_index = events.index(("prompt", "Enter your Jamf Pro username"))
+    assert any(kind == "echo" and "Checking" in msg for kind, msg in events[:prompt_index])
+    kind, msg = events[prompt_index - 1]
+    assert kind == "echo" and msg.startswith("\r") and not msg.strip()
+
+
+@pytest.mark.asyncio
+async def test_run_setup_standard_prompts_during_host_lookup(setup_instance):
+    events = []
+
+    def prompt(text, **kwargs):
+        events.append(text)
+        return {"Enter your Jamf Pro URL": "https://example.com"}.get(text, "answer")
+
+    async def wait_for_host_lookup():
+        events.append("host lookup awaited")
+
+    with (
+        patch("asyncclick.prompt", side_effect=prompt),
+        patch.object(setup_instance, "_wait_for_host_lookup", side_effect=wait_for_host_lookup),
+        patch.object(setup_instance, "_existing_integration") as mock_existing,
+        patch.object(setup_instance, "_fetch_basic_token", return_value="basic_token"),
+        patch.object(
+            setup_instance, "_configure_integration", return_value=("client_id", "client_secret")
+        ),
+        patch.object(setup_instance, "_token_fetching"),
+        patch.object(setup_instance, "_save_creds"),
+        patch.object(setup_instance, "_mark_completion"),
+        patch.object(setup_instance.animator, "update_msg"),
+        patch.object(setup_instance.animator.stop_event, "set"),
+    ):
+        await setup_instance._run_setup(SetupType.STANDARD)
+
+    # No stored client for the server, so credentials are typed while the host resolves
+    mock_existing.assert_not_called()
+    assert events == [
+        "Enter your Jamf Pro URL",
+        "Enter your Jamf Pro username",
+        "Enter your Jamf Pro password",
+        "host lookup awaited",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_basic_token_reprompts(setup_instance):
+    creds = {"URL": "https://example.com", "USERNAME": "user", "PASSWORD": "wrong"}
+    with (
+        patch("asyncclick.prompt", side_effect=["user", "right"]),
+        patch.object(
+            setup_instance,
+            "_token_fetching",
+            side_effect=[SetupError("Rejected", status_code=401), "basic_token"],
+        ) as mock_fetch,
+    ):
+        assert await setup_instance._fetch_basic_token(creds) == "basic_token"
+        assert mock_fetch.call_count == 2
+        assert creds["PASSWORD"] == "right"
+
+
+@pytest.mark.asyncio
+async def test_fetch_basic_token_reprompt_pauses_spinner(setup_instance):
+    creds = {"URL": "https://example.com", "USERNAME": "user", "PASSWORD": "wrong"}
+    animator = Animation()
+
+    def prompt(text, **kwargs):
+        assert animator.lock.locked()  # no spinner frames while prompting
+        return "right"
+
+    with (
+        patch("asyncclick.prompt", side_effect=prompt) as mock_prompt,
+        patch.object(
+            setup_instance,
+            "_token_fetching",
+            side_effect=[SetupError("Rejected", status_code=401), "basic_token"],
+        ),
+    ):
+        assert await setup_instance._fetch_basic_token(creds, animator=animator) == "basic_token"
+        assert mock_prompt.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_basic_token_max_attempts(setup_instance):
+    creds = {"URL": "https://example.com", "USERNAME": "user", "PASSWORD": "wrong"}
+    with (
+        patch("asyncclick.prompt", side_effect=["user", "wrong"]),
+        patch.object(
+            setup_instance, "_token_fetching", side_effect=SetupError("Rejected", status_code=403)
+        ),
+    ):
+        with pytest.raises(SetupError):
+            await setup_instance._fetch_basic_token(creds, max_attempts=2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [None, 404, 500])
+async def test_fetch_basic_token_other_errors_not_retried(setup_instance, status_code):
+    creds = {"URL": "https://example.com", "USERNAME": "user", "PASSWORD": "pass"}
+    with (
+        patch("asyncclick.prompt") as mock_prompt,
+        patch.object(
+            setup_instance,
+            "_token_fetching",
+            side_effect=SetupError("Failed", status_code=status_code),
+        ) as mock_fetch,
+    ):
+        with pytest.raises(SetupError):
+            await setup_instance._fetch_basic_token(creds)
+        mock_fetch.assert_called_once()
+        mock_prompt.assert_not_called()
+
+
+def test_stored_client_other_server(setup_instance):
+    assert setup_instance._stored_client("https://other.url") is None
+
+
+def test_stored_client_invalid_url(setup_instance):
+    assert setup_instance._stored_client("https://[abc") is None
+
+
+def test_stored_client_invalid_credentials(setup_instance):
+    setup_instance.config.get_credential.side_effect = lambda key: {
+        "URL": "https://mocked.url",
+        "CLIENT_ID": 1234,
+        "CLIENT_SECRET": "mock_client_secret",
+    }.get(key)
+    assert setup_instance._stored_client("https://mocked.url") is None
+
+
 @pytest.mark.asyncio
 async def test_run_setup_sso(setup_instance):
     mock_token = AccessToken(token="mock_token", expires=datetime(2028, 1, 1, tzinfo=timezone.utc))
@@ -157,4 +449,19 @@ async def test_run_setup_sso(setup_instance):
     ):
         await setup_instance._run_setup(SetupType.SSO)
         setup_instance._save_creds.assert_called_once()
+        setup_instance.config.create_client.assert_not_called()
         setup_instance._mark_completion.assert_called_once_with(value=True)
+
+
+@pytest.mark.asyncio
+async def test_start_invalid_choice_reprompts(setup_instance):
+    setup_instance._completed = False
+    with (
+        patch("asyncclick.prompt", side_effect=[3, 2]) as mock_prompt,
+        patch.object(setup_instance, "_greet") as mock_greet,
+        patch.object(setup_instance, "_run_setup") as mock_run_setup,
+    ):
+        await setup_instance.start()
+        assert mock_prompt.call_count == 2
+        mock_greet.assert_called_once()
+        mock_run_setup.assert_called_once_with(SetupType.SSO, animator=setup_instance.animator)
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
 
@@ -18,16 +20,15 @@ def test_token_manager_initialization(mock_token, config_manager):
     assert token_manager.token.expires == datetime(2030, 1, 1, tzinfo=timezone.utc)
 
 
+@pytest.mark.asyncio
 @patch.object(ConfigManager, "set_credential", new_callable=MagicMock)
-def test_save_token(mock_set_credential):
-    mock_config_manager = MagicMock()
-
-    mock_config_manager.set_credential = mock_set_credential
+async def test_save_token(mock_set_credential):
+    config_manager = ConfigManager()
 
-    token_manager = TokenManager(config=mock_config_manager)
+    token_manager = TokenManager(config=config_manager)
     token = AccessToken(token="new_token", expires=datetime(2031, 1, 1, tzinfo=timezone.utc))
 
-    token_manager._save_token(token)
+    await token_manager._save_token(token)
 
     expected_calls = [
         call("TOKEN", "new_token"),
@@ -36,6 +37,31 @@ def test_save_token(mock_set_credential):
     mock_set_credential.assert_has_calls(expected_calls, any_order=True)
 
 
+@pytest.mark.asyncio
+async def test_save_token_updates_cache_on_event_loop(token_manager):
+    old_token = AccessToken(
+        token="old_token", expires=datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    new_token = AccessToken(
+        token="new_token", expires=datetime.now(timezone.utc) + timedelta(hours=2)
+    )
+    token_manager._token = old_token
+    token_manager._refresh_at = 1.0
+
+    def write(credentials):
+        # Cache is still untouched while the keychain write runs in the worker thread
+        assert threading.current_thread() is not threading.main_thread()
+        assert token_manager._token is old_token
+        assert token_manager._refresh_at == 1.0
+
+    token_manager.config.set_credentials = MagicMock(side_effect=write)
+    await token_manager._save_token(new_token)
+
+    token_manager.config.set_credentials.assert_called_once()
+    assert token_manager._token is new_token
+    assert token_manager._refresh_at == 0.0
+
+
 @patch.object(TokenManager, "token", new_callable=PropertyMock)
 def test_token_valid_true(mock_token, token_manager):
     # Make future_time timezone-aware by specifying tzinfo
@@ -59,6 +85,16 @@ def test_token_valid_no_expiration(mock_token, token_manager):
     assert token_manager.token.is_expired is True
 
 
+def test_token_expiry_follows_expires_updates():
+    token = AccessToken(token="dummy_token", expires=datetime(1970, 1, 1, tzinfo=timezone.utc))
+    future_time = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    assert token.model_copy(update={"expires": future_time}).is_expired is False
+    token.expires = future_time
+    assert token.is_expired is False
+    assert token.seconds_remaining > 3500
+
+
 # Test validity
 @pytest.mark.asyncio
 @patch.object(AccessToken, "is_expired", new_callable=PropertyMock)
@@ -108,3 +144,145 @@ async def test_ensure_valid_token_invalid_token_fetch_failure(mock_token, token_
 
     # Ensure that fetch_token is called
     token_manager.fetch_token.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ensure_valid_token_concurrent_refresh(token_manager):
+    token_manager._token = AccessToken(
+        token="expired_token", expires=datetime.now(timezone.utc) - timedelta(seconds=1)
+    )
+
+    async def refresh():
+        await asyncio.sleep(0)
+        token_manager._token = AccessToken(
+            token="fresh_token", expires=datetime.now(timezone.utc) + timedelta(hours=1)
+        )
+
+    token_manager.fetch_token = AsyncMock(side_effect=refresh)
+
+    tokens = await asyncio.gather(*(token_manager.ensure_valid_token() for _ in range(3)))
+
+    # Only the first caller refreshes, the others wait on the lock and reuse its token
+    token_manager.fetch_token.assert_called_once()
+    assert all(token.token == "fresh_token" for token in tokens)
+
+
+def test_token_manager_with_client(config_manager, mock_jamf_client):
+    token_manager = TokenManager(config=config_manager, client=mock_jamf_client)
+    assert token_manager.client is mock_jamf_client
+    config_manager.get_credential.assert_not_called()
+
+
+def test_token_manager_with_api_client(config_manager, base_api_client):
+    token_manager = TokenManager(config=config_manager, api_client=base_api_client)
+    assert token_manager.api_client is base_api_client
+
+
+@pytest.mark.asyncio
+async def test_fetch_token_reuses_request(token_manager, mock_jamf_client):
+    token_manager._client = mock_jamf_client
+    token_manager.api_client.fetch_json = AsyncMock(
+        return_value={"access_token": "new_token_1234", "expires_in": 1800}
+    )
+    await token_manager.fetch_token()
+    await token_manager.fetch_token()
+    first, second = token_manager.api_client.fetch_json.call_args_list
+    assert first.args[0] == f"{mock_jamf_client.base_url}/api/oauth/token"
+    assert first.kwargs["data"] is second.kwargs["data"]
+    assert f"client_id={mock_jamf_client.client_id}" in first.kwargs["data"]
+    assert token_manager._token.token == "new_token_1234"
+
+
+@pytest.mark.asyncio
+async def test_ensure_valid_token_cached(token_manager):
+    token = AccessToken(
+        token="valid_token", expires=datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    token_manager._token = token
+    token_manager.fetch_token = AsyncMock()
+
+    assert await token_manager.ensure_valid_token() is token
+    with patch.object(TokenManager, "token", new_callable=PropertyMock) as mock_token:
+        assert await token_manager.ensure_valid_token() is token
+        mock_token.assert_not_called()
+    token_manager.fetch_token.assert_not_called()
+
+    await token_manager._save_token(token)
+    assert token_manager._token is token
+    assert token_manager._valid_until == 0.0
+
+
+@pytest.mark.asyncio
+async def test_ensure_valid_token_refreshes_early(token_manager):
+    token = AccessToken(
+        token="expiring_token", expires=datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    token_manager._token = token
+    token_manager.fetch_token = AsyncMock()
+
+    assert await token_manager.ensure_valid_token() is token
+    assert token_manager._refresh_task is None
+
+    # Within refresh_window of expiring, the token is still returned while the refresh runs
+    with patch("time.time", return_value=token.valid_until - 60):
+        assert await token_manager.ensure_valid_token() is token
+        assert token_manager._refresh_task is not None
+        await token_manager._refresh_task
+
+    token_manager.fetch_token.assert_called_once()
+    assert token_manager._refresh_task is None
+    assert token.valid_until - token_manager._refresh_at == token_manager.refresh_window
+
+
+@pytest.mark.asyncio
+async def test_ensure_valid_token_short_lived_token(token_manager):
+    token = AccessToken(
+        token="short_token", expires=datetime.now(timezone.utc) + timedelta(seconds=120)
+    )
+    token_manager._token = token
+    token_manager.fetch_token = AsyncMock()
+
+    # Window is capped at half the remaining lifetime instead of refreshing on every call
+    for _ in range(3):
+        assert await token_manager.ensure_valid_token() is token
+    assert token_manager._refresh_task is None
+    token_manager.fetch_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [TokenError("Unable to retrieve token"), RuntimeError("boom")])
+async def test_ensure_valid_token_early_refresh_failure_backs_off(token_manager, error):
+    token = AccessToken(
+        token="expiring_token", expires=datetime.now(timezone.utc) + timedelta(hours=1)
+    )
+    token_manager._token = token
+    token_manager.fetch_token = AsyncMock(side_effect=error)
+    await token_manager.ensure_valid_token()
+
+    in_window = token.valid_until - 60
+    with patch("time.time", return_value=in_window):
+        await token_manager.ensure_valid_token()
+        await token_manager._refresh_task
+
+        # Failure is logged, later calls reuse the token until the retry delay passed
+        assert await token_manager.ensure_valid_token() is token
+        assert token_manager._refresh_task is None
+    token_manager.fetch_token.assert_called_once()
+
+    with patch("time.time", return_value=in_window + TokenManager._REFRESH_RETRY_DELAY):
+        await token_manager.ensure_valid_token()
+        await token_manager._refresh_task
+    assert token_manager.fetch_token.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"access_token": "token", "expires_in": None},
+        {"access_token": "token", "expires_in": 0},
+        {"expires_in": 1800},
+    ],
+)
+def test_parse_token_response_invalid(token_manager, response):
+    with pytest.raises(TokenError):
+        token_manager._parse_token_response(response)
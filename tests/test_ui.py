@@ -24,7 +24,7 @@ def test_load_plist_file_valid(ui_manager):
 
 
 def test_load_plist_file_missing(ui_manager):
-    with patch.object(Path, "exists", return_value=False):
+    with patch.object(Path, "stat", side_effect=FileNotFoundError):
         result = ui_manager._load_plist_file()
         assert result == {}
 
@@ -40,10 +40,18 @@ def test_load_plist_file_corrupted(ui_manager):
 
 def test_write_plist_file_success(ui_manager):
     mock_data = {"UI": {"HEADER_TEXT": "Header", "FOOTER_TEXT": "Footer"}}
-    with patch.object(Path, "open", mock_open()) as mock_file, patch("plistlib.dump") as mock_dump:
+    with (
+        patch.object(Path, "open", mock_open()) as mock_file,
+        patch("plistlib.dump") as mock_dump,
+        patch("os.replace") as mock_replace,
+    ):
         ui_manager._write_plist_file(mock_data)
         mock_file.assert_called_once()
         mock_dump.assert_called_once_with(mock_data, mock_file())  # type: ignore
+        mock_replace.assert_called_once_with(
+            ui_manager.plist_path.with_name(f"{ui_manager.plist_path.name}.tmp"),
+            ui_manager.plist_path,
+        )
 
 
 def test_write_plist_file_error(ui_manager):
@@ -69,7 +77,7 @@ def test_config_load_existing(ui_manager):
     with (
         patch.object(Path, "exists", side_effect=lambda: True),
         patch("plistlib.load", return_value=mock_data),
-        patch.object(ui_manager, "_download_font", MagicMock()),
+        patch.object(ui_manager, "_download_fonts", MagicMock()),
     ):
         assert ui_manager.config == mock_data["UI"]
 
@@ -85,16 +93,31 @@ def test_config_load_default(ui_manager):
         assert config == {}
 
 
-def test_download_font_success(ui_manager):
-    with (patch.object(ui_manager.api, "execute_sync", return_value=b"Success") as mock_exec,):
-        ui_manager._download_font("http://example.com/font.ttf", Path("/mock/path/font.ttf"))
+def test_download_fonts_single_command(ui_manager):
+    with patch.object(ui_manager.api, "execute_sync", return_value=b"") as mock_exec:
+        ui_manager._download_fonts(
+            {
+                "http://example.com/regular.ttf": Path("/mock/path/regular.ttf"),
+                "http://example.com/bold.ttf": Path("/mock/path/bold.ttf"),
+            }
+        )
 
         mock_exec.assert_called_once_with(
-            ["/usr/bin/curl", "-sL", "http://example.com/font.ttf", "-o", "/mock/path/font.ttf"]
+            [
+                "/usr/bin/curl",
+                "-sL",
+                "--parallel",
+                "http://example.com/regular.ttf",
+                "-o",
+                "/mock/path/regular.ttf",
+                "http://example.com/bold.ttf",
+                "-o",
+                "/mock/path/bold.ttf",
+            ]
         )
 
 
-def test_download_font_failure(ui_manager):
+def test_download_fonts_failure(ui_manager):
     with (
         patch.object(Path, "mkdir"),
         patch.object(
@@ -102,12 +125,13 @@ def test_download_font_failure(ui_manager):
         ),
     ):
         with pytest.raises(PatcherError, match="Failed to download default font family"):
-            ui_manager._download_font("http://example.com/font.ttf", Path("/mock/path/font.ttf"))
+            ui_manager._download_fonts({"http://example.com/font.ttf": Path("/mock/path/font.ttf")})
 
 
 def test_reset_config_success(ui_manager):
     with (
         patch("plistlib.dump"),
+        patch("os.replace"),
         patch.object(Path, "open", mock_open(read_data=b"<plist>...")),
     ):
         assert ui_manager.reset_config() is True
@@ -122,3 +146,83 @@ def test_get_with_fallback(ui_manager):
     ui_manager._config = {"HEADER_TEXT": "Header"}
     assert ui_manager.config.get("HEADER_TEXT") == "Header"
     assert ui_manager.config.get("FOOTER_TEXT", "Default Footer") == "Default Footer"
+
+
+def test_load_plist_file_cached(ui_manager, tmp_path):
+    ui_manager.plist_path = tmp_path / "com.liquidzoo.patcher.plist"
+    ui_manager._write_plist_file({"UI": {"HEADER_TEXT": "Header"}})
+    with patch("plistlib.load") as mock_load:
+        assert ui_manager._load_plist_file() == {"UI": {"HEADER_TEXT": "Header"}}
+        mock_load.assert_not_called()
+
+    # Changes on disk are picked up on next load
+    ui_manager._plist_cache = (0, {})
+    assert ui_manager._load_plist_file() == {"UI": {"HEADER_TEXT": "Header"}}
+
+
+def test_save_ui_config_updates_config(ui_manager, tmp_path):
+    ui_manager.plist_path = tmp_path / "com.liquidzoo.patcher.plist"
+    ui_manager._write_plist_file({"Setup": {"first_run_done": True}})
+    ui_manager.save_ui_config("Header", "Footer", "Assistant", "/regular.ttf", "/bold.ttf")
+
+    with patch.object(ui_manager, "_load_plist_file") as mock_load:
+        assert ui_manager.config["HEADER_TEXT"] == "Header"
+        assert ui_manager.config["LOGO_PATH"] == ""
+        mock_load.assert_not_called()
+
+    plist_data = ui_manager._load_plist_file()
+    assert plist_data["Setup"] == {"first_run_done": True}
+    assert plist_data["UI"]["FONT_BOLD_PATH"] == "/bold.ttf"
+
+
+def test_copy_if_changed_skips_existing_copy(ui_manager, tmp_path):
+    src = tmp_path / "Custom-Regular.ttf"
+    dest = tmp_path / "fonts" / "Custom-Regular.ttf"
+    src.write_bytes(b"font data")
+    dest.parent.mkdir()
+
+    ui_manager._copy_if_changed(src, dest)
+    assert dest.read_bytes() == b"font data"
+    assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    with patch("shutil.copyfile") as mock_copy:
+        ui_manager._copy_if_changed(src, dest)
+        ui_manager._copy_if_changed(src, src)
+        mock_copy.assert_not_called()
+
+
+def test_config_setter_preserves_setup(ui_manager, tmp_path):
+    ui_manager.plist_path = tmp_path / "com.liquidzoo.patcher.plist"
+    ui_manager._write_plist_file({"Setup": {"first_run_done": True}, "UI": {"HEADER_TEXT": "Old"}})
+    ui_manager._config = {"HEADER_TEXT": "Old"}
+
+    ui_manager.config = {"HEADER_TEXT": "New"}
+
+    plist_data = ui_manager._load_plist_file()
+    assert plist_data == {"Setup": {"first_run_done": True}, "UI": {"HEADER_TEXT": "New"}}
+    assert not (tmp_path / "com.liquidzoo.patcher.plist.tmp").exists()
+
+
+def test_ensure_directory_memoized(ui_manager, tmp_path):
+    font_dir = tmp_path / "fonts"
+    ui_manager._ensure_directory(font_dir)
+    assert font_dir.is_dir()
+
+    with patch.object(Path, "exists") as mock_exists:
+        ui_manager._ensure_directory(font_dir)
+        mock_exists.assert_not_called()
+
+
+def test_configure_logo_does_not_write_plist(ui_manager, tmp_path):
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(b"")
+    with (
+        patch("asyncclick.prompt", return_value=str(logo)),
+        patch("PIL.Image.open", MagicMock()),
+        patch.object(ui_manager, "_copy_if_changed") as mock_copy,
+        patch.object(ui_manager, "_write_plist_file") as mock_write,
+    ):
+        result = ui_manager.configure_logo(use_logo=True)
+        assert result == str(ui_manager.plist_path.parent / "logo.png")
+        mock_copy.assert_called_once()
+        mock_write.assert_not_called()